@@ -10,17 +10,44 @@ Import examples:
 
 Convenience re-exports are provided at the package root for the most
 commonly used classes; explicit ``aeb.core`` imports remain the
-recommended style for clarity.
+recommended style for clarity. Root re-exports are resolved lazily
+(PEP 562) so ``import aeb`` only loads the core module that actually
+backs the symbol being accessed.
+
+The former flat modules (``aeb.constants``, ``aeb.system``, ...) no longer
+exist as files. Attribute access such as ``aeb.system.AEBSystem`` still
+resolves to the matching ``aeb.core`` module with a DeprecationWarning,
+issued only when a legacy name is actually touched.
 """
 
-from .core.constants import SafetyConstants
-from .core.enums import ObjectType, WeatherCondition, SystemState
-from .core.models import DetectedObject
-from .core.sensors import SensorSystem
-from .core.threat import ThreatAssessment
-from .core.decision import SafetyDecisionEngine
-from .core.system import AEBSystem
-from .core.simulation import AEBSimulation
+import importlib
+import warnings
+
+# Public name -> (module path, attribute) resolved on first access.
+_LAZY = {
+    "SafetyConstants": ("aeb.core.constants", "SafetyConstants"),
+    "ObjectType": ("aeb.core.enums", "ObjectType"),
+    "WeatherCondition": ("aeb.core.enums", "WeatherCondition"),
+    "SystemState": ("aeb.core.enums", "SystemState"),
+    "DetectedObject": ("aeb.core.models", "DetectedObject"),
+    "SensorSystem": ("aeb.core.sensors", "SensorSystem"),
+    "ThreatAssessment": ("aeb.core.threat", "ThreatAssessment"),
+    "SafetyDecisionEngine": ("aeb.core.decision", "SafetyDecisionEngine"),
+    "AEBSystem": ("aeb.core.system", "AEBSystem"),
+    "AEBSimulation": ("aeb.core.simulation", "AEBSimulation"),
+}
+
+# Deprecated flat module names -> canonical core module (removal: 0.4.0).
+_LEGACY = {
+    "constants": "aeb.core.constants",
+    "enums": "aeb.core.enums",
+    "models": "aeb.core.models",
+    "sensors": "aeb.core.sensors",
+    "threat": "aeb.core.threat",
+    "decision": "aeb.core.decision",
+    "system": "aeb.core.system",
+    "simulation": "aeb.core.simulation",
+}
 
 __all__ = [
     "SafetyConstants",
@@ -34,3 +61,26 @@ __all__ = [
     "AEBSystem",
     "AEBSimulation",
 ]
+
+
+def __getattr__(name):
+    if name in _LEGACY:
+        warnings.warn(
+            f"'aeb.{name}' is deprecated; use '{_LEGACY[name]}'. Scheduled for removal in 0.4.0.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        value = importlib.import_module(_LEGACY[name])
+        globals()[name] = value  # warn once per process
+        return value
+    try:
+        module_path, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_path), attr)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+"""Allow ``python -m aeb`` to run the requirement validation demo."""
+from aeb.cli import main
+
+main()
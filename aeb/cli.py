@@ -0,0 +1,29 @@
+"""Command-line entrypoint for the requirement validation demo.
+
+Shared by ``main.py``, ``python -m aeb`` and the ``aeb-demo`` script. The
+simulation (and with it NumPy and the core modules) is imported only when
+``main`` runs.
+"""
+from importlib import import_module
+
+
+def main():
+    """
+    Run the AEB requirement validation demo and print summary.
+    """
+    print("AEB Safety-Critical System Prototype")
+    print("=" * 50)
+    print("Demonstrating requirement validation for urban collision avoidance\n")
+
+    AEBSimulation = import_module("aeb.core.simulation").AEBSimulation
+    simulation = AEBSimulation()
+    simulation.run_requirement_validation_tests()
+
+    print("\n" + "=" * 50)
+    print("AEB Prototype Demonstration Complete")
+    print("This prototype validates the safety-critical requirement")
+    print("engineering methodology for urban AEB systems.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 class SafetyConstants:
 	MAX_DETECTION_RANGE = 50.0      # Req 1: 50m detection range
 	MIN_TTC_THRESHOLD = 1.5         # Req 4: 1.5s TTC threshold
+	LANE_HALF_WIDTH = 2.0           # Ego path corridor: |lateral| <= 2m
 	MAX_RESPONSE_TIME = 0.1         # Req 6: 100ms response time
 	WARNING_ADVANCE_TIME = 0.5      # Req 5: 0.5s warning before braking
 	MIN_DETECTION_ACCURACY = 0.95   # Req 2: 95% classification accuracy
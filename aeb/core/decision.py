@@ -1,11 +1,62 @@
 """Core safety decision engine (relocated)."""
 import time
+from collections import deque
 from datetime import datetime
 from typing import Optional
 from .enums import SystemState
-from .models import DetectedObject
+from .models import Decision, DetectedObject
 from .constants import SafetyConstants
 
+try:
+	from numba import njit
+except ImportError:  # optional accelerator; plain Python otherwise
+	njit = None
+
+# Oldest events are dropped beyond this many so long runs stay bounded.
+EVENT_LOG_LIMIT = 10_000
+
+# Thresholds bound once at import (plain module globals for the hot path)
+_MIN_TTC = SafetyConstants.MIN_TTC_THRESHOLD
+_WARN_TTC = SafetyConstants.MIN_TTC_THRESHOLD + SafetyConstants.WARNING_ADVANCE_TIME
+_MAX_RESPONSE = SafetyConstants.MAX_RESPONSE_TIME
+
+# Integer codes used by _decide; tuples decode them for the Python wrapper.
+_ACTIONS = ('FAIL_SAFE', 'EMERGENCY_BRAKE', 'WARNING', 'MONITOR')
+_ACT_FAIL_SAFE, _ACT_EMERGENCY_BRAKE, _ACT_WARNING, _ACT_MONITOR = range(len(_ACTIONS))
+_STATES = tuple(SystemState)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+_ST_OPERATIONAL = _STATE_CODES[SystemState.OPERATIONAL]
+_ST_WARNING = _STATE_CODES[SystemState.WARNING]
+_ST_EMERGENCY_BRAKING = _STATE_CODES[SystemState.EMERGENCY_BRAKING]
+_ST_SENSOR_FAILURE = _STATE_CODES[SystemState.SENSOR_FAILURE]
+
+
+def _decide(threat_detected, ttc, reliability, state, warning_issued, emergency_active):
+	"""Pure decision state machine on scalars and int codes.
+
+	Returns ``(action, state, warning_issued, emergency_active)``. Kept free of
+	objects and I/O so it can be compiled (Numba when installed).
+	"""
+	if reliability < 0.5:
+		return _ACT_FAIL_SAFE, _ST_SENSOR_FAILURE, warning_issued, emergency_active
+	if not threat_detected:
+		warning_issued = False
+		emergency_active = False
+		state = _ST_OPERATIONAL
+	elif ttc <= _WARN_TTC and not warning_issued:
+		warning_issued = True
+		state = _ST_WARNING
+	if threat_detected and ttc <= _MIN_TTC:
+		return _ACT_EMERGENCY_BRAKE, _ST_EMERGENCY_BRAKING, warning_issued, True
+	if warning_issued:
+		return _ACT_WARNING, state, warning_issued, emergency_active
+	return _ACT_MONITOR, state, warning_issued, emergency_active
+
+
+if njit is not None:
+	_decide = njit(cache=True, nogil=True)(_decide)
+	_decide(True, 1.0, 1.0, _ST_OPERATIONAL, False, False)  # compile at import
+
 
 class SafetyDecisionEngine:
 	def __init__(self):
@@ -13,71 +64,51 @@ class SafetyDecisionEngine:
 		self.last_decision_time = time.time()
 		self.warning_issued = False
 		self.emergency_active = False
-		self.event_log = []
+		# Events carry monotonic 'ts_ns' stamps; wall-clock datetimes are derived
+		# from this anchor only when reported (see timestamped_events).
+		self.event_log = deque(maxlen=EVENT_LOG_LIMIT)
+		self._wall_anchor_ns = time.time_ns()
+		self._mono_anchor_ns = time.monotonic_ns()
 
 	def make_safety_decision(self, threat_detected: bool, threat_object: Optional[DetectedObject],
-							 ttc: float, sensor_reliability: float) -> dict:
-		decision_start_time = time.time()
-		if sensor_reliability < 0.5:
-			self.system_state = SystemState.SENSOR_FAILURE
-			return {
-				'action': 'FAIL_SAFE',
-				'warning': True,
-				'braking': False,
-				'message': 'SENSOR FAILURE - DRIVER TAKEOVER REQUIRED',
-				'response_time': time.time() - decision_start_time
-			}
-		if not threat_detected:
-			self.warning_issued = False
-			self.emergency_active = False
-			self.system_state = SystemState.OPERATIONAL
-		if threat_detected and ttc <= SafetyConstants.MIN_TTC_THRESHOLD + SafetyConstants.WARNING_ADVANCE_TIME:
-			if not self.warning_issued:
-				self.warning_issued = True
-				self.system_state = SystemState.WARNING
-		if threat_detected and ttc <= SafetyConstants.MIN_TTC_THRESHOLD:
-			self.emergency_active = True
-			self.system_state = SystemState.EMERGENCY_BRAKING
+							 ttc: float, sensor_reliability: float) -> Decision:
+		t0 = time.perf_counter_ns()
+		action, state, self.warning_issued, self.emergency_active = _decide(
+			bool(threat_detected), float(ttc), float(sensor_reliability),
+			_STATE_CODES[self.system_state], self.warning_issued, self.emergency_active,
+		)
+		self.system_state = _STATES[state]
+		if action == _ACT_EMERGENCY_BRAKE:
 			self.log_emergency_event(threat_object, ttc)
-			decision_time = time.time() - decision_start_time
-			if decision_time > SafetyConstants.MAX_RESPONSE_TIME:
+			decision_time = (time.perf_counter_ns() - t0) * 1e-9
+			if decision_time > _MAX_RESPONSE:
 				self.event_log.append({
-					'timestamp': datetime.now(),
+					'ts_ns': time.monotonic_ns(),
 					'event': 'RESPONSE_TIME_VIOLATION',
 					'actual_time': decision_time,
-					'required_time': SafetyConstants.MAX_RESPONSE_TIME
+					'required_time': _MAX_RESPONSE
 				})
-			return {
-				'action': 'EMERGENCY_BRAKE',
-				'warning': True,
-				'braking': True,
-				'message': f'EMERGENCY BRAKING - TTC: {ttc:.2f}s',
-				'response_time': decision_time,
-				'threat_object': threat_object
-			}
-		elif self.warning_issued:
-			return {
-				'action': 'WARNING',
-				'warning': True,
-				'braking': False,
-				'message': f'COLLISION WARNING - TTC: {ttc:.2f}s',
-				'response_time': time.time() - decision_start_time,
-				'threat_object': threat_object
-			}
-		return {
-			'action': 'MONITOR',
-			'warning': False,
-			'braking': False,
-			'message': 'MONITORING - ALL CLEAR',
-			'response_time': time.time() - decision_start_time
-		}
+			return Decision('EMERGENCY_BRAKE', True, True, ttc, decision_time, threat_object)
+		return Decision(
+			_ACTIONS[action], action != _ACT_MONITOR, False, ttc,
+			(time.perf_counter_ns() - t0) * 1e-9,
+			threat_object if action == _ACT_WARNING else None,
+		)
 
 	def log_emergency_event(self, threat_object: Optional[DetectedObject], ttc: float):
 		self.event_log.append({
-			'timestamp': datetime.now(),
+			'ts_ns': time.monotonic_ns(),
 			'event': 'EMERGENCY_BRAKING',
 			'ttc': ttc,
 			'object_type': threat_object.type.value if threat_object else 'unknown',
 			'object_distance': threat_object.distance if threat_object else 0,
 			'system_state': self.system_state.value
 		})
+
+	def timestamped_events(self) -> list:
+		"""Copy of ``event_log`` with a wall-clock ``timestamp`` added to each event."""
+		offset_ns = self._wall_anchor_ns - self._mono_anchor_ns
+		return [
+			{'timestamp': datetime.fromtimestamp((event['ts_ns'] + offset_ns) / 1e9), **event}
+			for event in self.event_log
+		]
@@ -8,6 +8,14 @@ class ObjectType(Enum):
 	STATIC_OBSTACLE = "static"
 	UNKNOWN = "unknown"
 
+# Compact integer codes for ObjectType, used by struct-of-arrays detection
+# columns and vectorized threat kernels; index the tuple to decode.
+OBJECT_TYPE_CODES = {t: i for i, t in enumerate(ObjectType)}
+OBJECT_TYPES_BY_CODE = tuple(ObjectType)
+# Scenario dicts carry the string value; builders may also store the code
+# under 'type_code' so the detection path skips the lookup entirely.
+TYPE_CODES_BY_VALUE = {t.value: code for t, code in OBJECT_TYPE_CODES.items()}
+
 class WeatherCondition(Enum):
 	CLEAR = "clear"
 	LIGHT_RAIN = "light_rain"
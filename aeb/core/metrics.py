@@ -0,0 +1,104 @@
+"""Core performance-metric containers."""
+from dataclasses import dataclass, field
+import numpy as np
+
+# Trailing samples kept per history for inspection; report statistics come
+# from running values and cover the whole run.
+METRICS_WINDOW = 10_000
+
+
+class RingBuffer:
+	"""Fixed-capacity ring of float samples in a preallocated NumPy array.
+
+	Keeps the most recent ``capacity`` values. Appends are O(1) writes with no
+	reallocation; float32 storage halves the footprint of long histories.
+	"""
+	__slots__ = ("_data", "_count")
+
+	def __init__(self, capacity: int, dtype=np.float32):
+		self._data = np.empty(capacity, dtype=dtype)
+		self._count = 0  # total values ever appended
+
+	def append(self, value: float):
+		self._data[self._count % self._data.size] = value
+		self._count += 1
+
+	def extend(self, values):
+		values = np.asarray(values.values() if isinstance(values, RingBuffer) else values, dtype=self._data.dtype)
+		size = self._data.size
+		if len(values) > size:
+			self._count += len(values) - size
+			values = values[-size:]
+		self._data[(self._count + np.arange(len(values))) % size] = values
+		self._count += len(values)
+
+	def values(self) -> np.ndarray:
+		"""Retained samples, oldest first (a copy)."""
+		size = self._data.size
+		if self._count <= size:
+			return self._data[:self._count].copy()
+		start = self._count % size
+		return np.concatenate((self._data[start:], self._data[:start]))
+
+	def __len__(self) -> int:
+		return min(self._count, self._data.size)
+
+	def __iter__(self):
+		return iter(self.values().tolist())
+
+	def __repr__(self) -> str:
+		return f"RingBuffer({self.values().tolist()!r}, capacity={self._data.size})"
+
+
+@dataclass(slots=True)
+class PerfMetrics:
+	"""Per-system decision statistics with O(1) updates and reports.
+
+	Means are maintained incrementally (Welford); the ring buffers keep the
+	latest samples only.
+	"""
+	total_decisions: int = 0
+	emergency_braking_events: int = 0
+	false_positives: int = 0
+	rt_mean: float = 0.0
+	rt_max: float = 0.0
+	accuracy_mean: float = 0.0
+	response_times: RingBuffer = field(default_factory=lambda: RingBuffer(METRICS_WINDOW))
+	detection_accuracy: RingBuffer = field(default_factory=lambda: RingBuffer(METRICS_WINDOW))
+
+	def record(self, response_time: float, accuracy: float, emergency: bool):
+		self.total_decisions += 1
+		n = self.total_decisions
+		if emergency:
+			self.emergency_braking_events += 1
+		self.response_times.append(response_time)
+		self.rt_mean += (response_time - self.rt_mean) / n
+		if response_time > self.rt_max:
+			self.rt_max = response_time
+		self.detection_accuracy.append(accuracy)
+		self.accuracy_mean += (accuracy - self.accuracy_mean) / n
+
+	def merge(self, other: "PerfMetrics"):
+		"""Fold ``other`` in; means are combined weighted by decision counts."""
+		if not other.total_decisions:
+			return
+		n = self.total_decisions + other.total_decisions
+		weight = other.total_decisions / n
+		self.rt_mean += (other.rt_mean - self.rt_mean) * weight
+		self.accuracy_mean += (other.accuracy_mean - self.accuracy_mean) * weight
+		self.rt_max = max(self.rt_max, other.rt_max)
+		self.total_decisions = n
+		self.emergency_braking_events += other.emergency_braking_events
+		self.false_positives += other.false_positives
+		self.response_times.extend(other.response_times)
+		self.detection_accuracy.extend(other.detection_accuracy)
+
+	def as_dict(self) -> dict:
+		"""Legacy ``performance_metrics`` layout (histories are shared, not copied)."""
+		return {
+			'total_decisions': self.total_decisions,
+			'emergency_braking_events': self.emergency_braking_events,
+			'false_positives': self.false_positives,
+			'response_times': self.response_times,
+			'detection_accuracy': self.detection_accuracy
+		}
@@ -1,7 +1,9 @@
 """Core data models (relocated)."""
-from dataclasses import dataclass
-from typing import Tuple
-from .enums import ObjectType
+from dataclasses import dataclass, field, fields
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+import numpy as np
+from .enums import ObjectType, OBJECT_TYPE_CODES, OBJECT_TYPES_BY_CODE
+from .constants import SafetyConstants
 
 @dataclass
 class DetectedObject:
@@ -12,3 +14,138 @@ class DetectedObject:
 	confidence: float
 	distance: float
 	size: Tuple[float, float]
+
+
+_DECISION_MESSAGES = {
+	'FAIL_SAFE': lambda d: 'SENSOR FAILURE - DRIVER TAKEOVER REQUIRED',
+	'EMERGENCY_BRAKE': lambda d: f'EMERGENCY BRAKING - TTC: {d.ttc:.2f}s',
+	'WARNING': lambda d: f'COLLISION WARNING - TTC: {d.ttc:.2f}s',
+	'MONITOR': lambda d: 'MONITORING - ALL CLEAR',
+}
+
+
+@dataclass(slots=True)
+class Decision:
+	"""Outcome of one ``SafetyDecisionEngine.make_safety_decision`` call.
+
+	``message`` is formatted on first access and memoised. Item access (``decision['braking']``,
+	``decision.get(...)``) is kept for code written against the former dict.
+	"""
+	action: str
+	warning: bool
+	braking: bool
+	ttc: float
+	response_time: float
+	threat_object: Optional[DetectedObject] = None
+	# functools.cached_property needs an instance __dict__, which slots=True removes
+	_message: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+	@property
+	def message(self) -> str:
+		if self._message is None:
+			self._message = _DECISION_MESSAGES[self.action](self)
+		return self._message
+
+	def __getitem__(self, key: str):
+		if key not in _DECISION_KEYS:
+			raise KeyError(key)
+		return getattr(self, key)
+
+	def get(self, key: str, default=None):
+		return getattr(self, key) if key in _DECISION_KEYS else default
+
+	def to_dict(self) -> dict:
+		return {key: getattr(self, key) for key in _DECISION_KEYS}
+
+
+_DECISION_KEYS = ('message',) + tuple(f.name for f in fields(Decision) if f.init)
+
+
+class Detections:
+	"""Struct-of-arrays batch of detected objects.
+
+	Each attribute is a NumPy column with one row per detection, so threat
+	assessment can run as whole-array operations. The batch also behaves as a
+	read-only sequence of ``DetectedObject`` (``len``, indexing, iteration);
+	rows are only materialized when accessed that way.
+	"""
+	__slots__ = ("ids", "type_codes", "positions", "velocities", "confidences", "distances", "sizes", "in_lane", "in_range")
+
+	def __init__(self, ids: np.ndarray, type_codes: np.ndarray, positions: np.ndarray,
+				 velocities: np.ndarray, confidences: np.ndarray, distances: np.ndarray,
+				 sizes: np.ndarray, in_range: Optional[int] = None,
+				 in_lane: Optional[np.ndarray] = None):
+		self.ids = ids                  # (N,) int, index into the source scenario
+		self.type_codes = type_codes    # (N,) int8, see OBJECT_TYPE_CODES
+		self.positions = positions      # (N, 2) float64, noisy sensor position
+		self.velocities = velocities    # (N, 2) float64
+		self.confidences = confidences  # (N,) float64
+		self.distances = distances      # (N,) float64, true range to ego
+		self.sizes = sizes              # (N, 2) float64
+		self.in_range = in_range        # scenario objects within range before drops, if known
+		if in_lane is None:
+			in_lane = np.abs(positions[:, 1]) <= SafetyConstants.LANE_HALF_WIDTH
+		self.in_lane = in_lane          # (N,) bool, reported position inside the ego corridor
+
+	@classmethod
+	def from_objects(cls, objects: List[DetectedObject]) -> "Detections":
+		"""Pack a list of ``DetectedObject`` into columns."""
+		n = len(objects)
+		return cls(
+			ids=np.fromiter((o.id for o in objects), dtype=np.intp, count=n),
+			type_codes=np.fromiter((OBJECT_TYPE_CODES[o.type] for o in objects), dtype=np.int8, count=n),
+			positions=np.asarray([o.position for o in objects], dtype=np.float64).reshape(n, 2),
+			velocities=np.asarray([o.velocity for o in objects], dtype=np.float64).reshape(n, 2),
+			confidences=np.fromiter((o.confidence for o in objects), dtype=np.float64, count=n),
+			distances=np.fromiter((o.distance for o in objects), dtype=np.float64, count=n),
+			sizes=np.asarray([o.size for o in objects], dtype=np.float64).reshape(n, 2),
+		)
+
+	def __len__(self) -> int:
+		return len(self.ids)
+
+	def __getitem__(self, i: int) -> DetectedObject:
+		return DetectedObject(
+			id=int(self.ids[i]),
+			type=OBJECT_TYPES_BY_CODE[self.type_codes[i]],
+			position=tuple(self.positions[i].tolist()),
+			velocity=tuple(self.velocities[i].tolist()),
+			confidence=float(self.confidences[i]),
+			distance=float(self.distances[i]),
+			size=tuple(self.sizes[i].tolist()),
+		)
+
+	def __iter__(self) -> Iterator[DetectedObject]:
+		return (self[i] for i in range(len(self)))
+
+	def __repr__(self) -> str:
+		return f"Detections({list(self)!r})"
+
+
+class FrameResult(NamedTuple):
+	"""Per-frame outcome returned by ``AEBSystem.process_scenario*``.
+
+	``detected_objects`` is None for ``process_scenario_fast`` unless
+	``detailed=True``; ``threat_object`` is the single materialized row, if
+	any. String-key access (``result['decision']``, ``result.get(...)``) is
+	kept for code written against the former result dict.
+	"""
+	threat_detected: bool
+	min_ttc: float
+	min_ttc_all: float
+	decision: Decision
+	sensor_reliability: float
+	system_state: str
+	detected_count: int
+	threat_object: Optional[DetectedObject] = None
+	detected_objects: Optional[Detections] = None
+
+	def __getitem__(self, key):
+		if isinstance(key, str):
+			if key not in self._fields:
+				raise KeyError(key)
+			return getattr(self, key)
+		return tuple.__getitem__(self, key)
+
+	def get(self, key: str, default=None):
+		return getattr(self, key) if key in self._fields else default
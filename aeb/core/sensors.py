@@ -1,25 +1,51 @@
 """Core sensor system implementation (relocated).
 
+Detection is vectorized: drops, noise and confidences for all scenario
+objects are drawn in one batch from a per-instance ``numpy.random.Generator``
+and distances / range gating are whole-array operations. Pass ``seed`` (or call
+``reseed``) for reproducible detection sequences, e.g. when replaying a run.
+
 Security / Quality:
-	Uses SystemRandom for stochastic drops / noise to eliminate Sonar hotspot
-	(python:S2245). Crypto strength not required but harmless here.
+	The generator models sensor noise only; no cryptographic use (Sonar
+	python:S2245 reviewed).
 """
-import random
 import numpy as np
-from typing import List
-from .enums import WeatherCondition, ObjectType
-from .models import DetectedObject
+from typing import List, Optional, Tuple
+from .enums import WeatherCondition, TYPE_CODES_BY_VALUE
+from .models import Detections
 from .constants import SafetyConstants
 
-RNG = random.SystemRandom()
+# (keep mask, (N, 2) position noise, confidence) drawn for one scenario
+DetectionSamples = Tuple[np.ndarray, np.ndarray, np.ndarray]
+# (type codes, (N, 2) sizes): per-object columns that do not change as objects move
+ObjectColumns = Tuple[np.ndarray, np.ndarray]
+
+def _type_code(obj: dict) -> int:
+	code = obj.get('type_code')
+	return TYPE_CODES_BY_VALUE[obj['type']] if code is None else code
+
+_MAX_RANGE_SQ = SafetyConstants.MAX_DETECTION_RANGE ** 2
+_LANE_HALF_WIDTH = SafetyConstants.LANE_HALF_WIDTH
+
+_WEATHER_FACTORS = {
+	WeatherCondition.CLEAR: 1.0,
+	WeatherCondition.LIGHT_RAIN: 0.90,
+	WeatherCondition.FOG: 0.75,
+	WeatherCondition.NIGHT: 0.92
+}
 
 class SensorSystem:
-	def __init__(self):
+	def __init__(self, seed: Optional[int] = None):
 		self.camera_operational = True
 		self.radar_operational = True
 		self.lidar_operational = True
 		self.weather_condition = WeatherCondition.CLEAR
 		self.extra_degradation_prob = 0.0
+		self._rng = np.random.default_rng(seed)
+
+	def reseed(self, seed: Optional[int]):
+		"""Restart the sensor noise stream; the same seed replays the same samples."""
+		self._rng = np.random.default_rng(seed)
 
 	def set_detection_degradation(self, active: bool, probability: float = 0.35):
 		if active:
@@ -39,39 +65,81 @@ class SensorSystem:
 			self.lidar_operational = False
 
 	def get_sensor_reliability(self) -> float:
-		operational_sensors = sum([
-			self.camera_operational,
-			self.radar_operational,
-			self.lidar_operational
-		])
-		weather_factor = {
-			WeatherCondition.CLEAR: 1.0,
-			WeatherCondition.LIGHT_RAIN: 0.90,
-			WeatherCondition.FOG: 0.75,
-			WeatherCondition.NIGHT: 0.92
-		}[self.weather_condition]
-		return (operational_sensors / 3.0) * weather_factor
-
-	def detect_objects(self, scenario_objects: List[dict]) -> List[DetectedObject]:
-		detected_objects = []
+		"""Current reliability, computed on read so direct attribute writes count."""
+		operational_sensors = self.camera_operational + self.radar_operational + self.lidar_operational
+		return (operational_sensors / 3.0) * _WEATHER_FACTORS[self.weather_condition]
+
+	def sample_detections(self, scenario_objects: List[dict]) -> DetectionSamples:
+		"""Draw the stochastic part of detection for all scenario objects at once.
+
+		Returns ``(keep, noise, confidence)`` arrays with one row per object:
+		``keep`` is False for objects dropped by degradation or unreliability.
+		Samples depend only on the current sensor configuration, not on object
+		positions; ``detections_from_samples`` projects them onto the objects'
+		current positions.
+		"""
+		n = len(scenario_objects)
+		rng = self._rng
 		reliability = self.get_sensor_reliability()
-		for i, obj in enumerate(scenario_objects):
-			if self.extra_degradation_prob > 0 and RNG.random() < self.extra_degradation_prob:
-				continue
-			if RNG.random() < reliability:
-				noise_factor = 1 - reliability * 0.1
-				detected_obj = DetectedObject(
-					id=i,
-					type=ObjectType(obj['type']),
-					position=(
-						obj['position'][0] + RNG.gauss(0, noise_factor),
-						obj['position'][1] + RNG.gauss(0, noise_factor)
-					),
-					velocity=obj['velocity'],
-					confidence=reliability * RNG.uniform(0.9, 1.0),
-					distance=np.sqrt(obj['position'][0]**2 + obj['position'][1]**2),
-					size=obj['size']
-				)
-				if detected_obj.distance <= SafetyConstants.MAX_DETECTION_RANGE:
-					detected_objects.append(detected_obj)
-		return detected_objects
+		noise_factor = 1 - reliability * 0.1
+		keep = (rng.random(n) >= self.extra_degradation_prob) & (rng.random(n) < reliability)
+		noise = rng.standard_normal((n, 2)) * noise_factor
+		confidence = reliability * rng.uniform(0.9, 1.0, n)
+		return keep, noise, confidence
+
+	def sample_detections_batch(self, frames: int, n: int) -> Tuple[np.ndarray, np.ndarray]:
+		"""Draw ``(keep, noise)`` for ``frames`` independent frames of ``n`` objects.
+
+		Shapes are (K, N) and (K, N, 2); used by Monte-Carlo sweeps that do not
+		need per-detection confidences.
+		"""
+		rng = self._rng
+		reliability = self.get_sensor_reliability()
+		keep = (rng.random((frames, n)) >= self.extra_degradation_prob) & (rng.random((frames, n)) < reliability)
+		noise = rng.standard_normal((frames, n, 2)) * (1 - reliability * 0.1)
+		return keep, noise
+
+	def object_columns(self, scenario_objects: List[dict]) -> ObjectColumns:
+		"""Deterministic per-object columns, reusable while the object set is unchanged."""
+		n = len(scenario_objects)
+		return (
+			np.fromiter(map(_type_code, scenario_objects), dtype=np.int8, count=n),
+			np.asarray([obj['size'] for obj in scenario_objects], dtype=np.float64).reshape(n, 2),
+		)
+
+	def detections_from_samples(self, scenario_objects: List[dict], samples: DetectionSamples,
+								columns: Optional[ObjectColumns] = None) -> Detections:
+		"""Build detections for the objects' current positions from drawn samples.
+
+		``columns`` (see ``object_columns``) supplies type codes and sizes for
+		the whole object set; they are read from the hit objects otherwise.
+		"""
+		keep, noise, confidence = samples
+		pos = np.asarray([obj['position'] for obj in scenario_objects], dtype=np.float64).reshape(-1, 2)
+		# Range gate on squared true distance (noise only perturbs the reported
+		# position); sqrt is taken only for the surviving detections below
+		d2 = np.einsum('ij,ij->i', pos, pos)
+		in_range = d2 <= _MAX_RANGE_SQ
+		hits = np.flatnonzero(keep & in_range)
+		n = len(hits)
+		positions = (pos + noise)[hits]
+		hit_objects = [scenario_objects[i] for i in hits.tolist()]
+		if columns is None:
+			type_codes = np.fromiter(map(_type_code, hit_objects), dtype=np.int8, count=n)
+			sizes = np.asarray([obj['size'] for obj in hit_objects], dtype=np.float64).reshape(n, 2)
+		else:
+			type_codes, sizes = columns[0][hits], columns[1][hits]
+		return Detections(
+			ids=hits,
+			type_codes=type_codes,
+			positions=positions,
+			velocities=np.asarray([obj['velocity'] for obj in hit_objects], dtype=np.float64).reshape(n, 2),
+			confidences=confidence[hits],
+			distances=np.sqrt(d2[hits]),
+			sizes=sizes,
+			in_range=int(np.count_nonzero(in_range)),
+			in_lane=np.abs(positions[:, 1]) <= _LANE_HALF_WIDTH,
+		)
+
+	def detect_objects(self, scenario_objects: List[dict]) -> Detections:
+		return self.detections_from_samples(scenario_objects, self.sample_detections(scenario_objects))
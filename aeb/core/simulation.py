@@ -7,6 +7,15 @@ redundancy cleanup. External code should import:
 	from aeb.core.simulation import AEBSimulation
 """
 
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, TextIO
+
+from .models import FrameResult
 from .system import AEBSystem
 from .enums import WeatherCondition
 from .constants import SafetyConstants
@@ -51,13 +60,57 @@ class AEBSimulation:
 			'size': [0.6, 1.8]
 		}]
 
+	# --- Parallel Sweeps ---------------------------------------------------
+	def run_parallel(self, scenarios: List[List[dict]], workers: Optional[int] = None) -> List[FrameResult]:
+		"""Evaluate independent scenarios on a thread pool, results in input order.
+
+		Each worker thread owns an ``AEBSystem`` configured like
+		``self.aeb_system`` (speed, weather, degradation, failed sensors); NumPy
+		releases the GIL in its array kernels. Worker metrics are merged into
+		``self.aeb_system`` afterwards.
+		"""
+		local = threading.local()
+		systems = []
+		lock = threading.Lock()
+
+		def evaluate(scenario):
+			system = getattr(local, 'system', None)
+			if system is None:
+				system = local.system = self._worker_system()
+				with lock:
+					systems.append(system)
+			return system.process_scenario(scenario)
+
+		with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+			results = list(pool.map(evaluate, scenarios))
+		for system in systems:
+			self.aeb_system.merge_metrics(system)
+		return results
+
+	def _worker_system(self) -> AEBSystem:
+		src = self.aeb_system.sensor_system
+		system = AEBSystem(self.aeb_system.vehicle_speed)
+		dst = system.sensor_system
+		dst.set_weather_condition(src.weather_condition)
+		dst.set_detection_degradation(src.extra_degradation_prob > 0, src.extra_degradation_prob)
+		for sensor in ("camera", "radar", "lidar"):
+			if not getattr(src, f"{sensor}_operational"):
+				dst.simulate_sensor_failure(sensor)
+		return system
+
 	# --- Validation Suite --------------------------------------------------
-	def run_requirement_validation_tests(self):
-		"""Run a suite of requirement validation tests and print results."""
-		print("=== AEB System Requirement Validation Tests ===\n")
+	def run_requirement_validation_tests(self, stream: Optional[TextIO] = None):
+		"""Run a suite of requirement validation tests and print results.
+
+		Output is collected in memory and written to ``stream`` (default
+		``sys.stdout``) in a single call once the suite has finished.
+		"""
+		buf = io.StringIO()
+		out = partial(print, file=buf)
+		out("=== AEB System Requirement Validation Tests ===\n")
 
 		# Requirement 1: Detection range
-		print("Testing Req 1: 50m Detection Range")
+		out("Testing Req 1: 50m Detection Range")
 		far_scenario = [{
 			'type': 'pedestrian',
 			'position': [60.0, 1.0],
@@ -65,11 +118,11 @@ class AEBSimulation:
 			'size': [0.6, 1.8]
 		}]
 		result = self.aeb_system.process_scenario(far_scenario)
-		print(f"Objects beyond 50m detected: {len(result['detected_objects'])} (should be 0)")
-		print(f"✓ Req 1 {'PASSED' if len(result['detected_objects']) == 0 else 'FAILED'}\n")
+		out(f"Objects beyond 50m detected: {result.detected_count} (should be 0)")
+		out(f"✓ Req 1 {'PASSED' if result.detected_count == 0 else 'FAILED'}\n")
 
 		# Requirement 4: Emergency braking TTC threshold
-		print("Testing Req 4: Emergency Braking TTC Threshold")
+		out("Testing Req 4: Emergency Braking TTC Threshold")
 		close_scenario = [{
 			'type': 'pedestrian',
 			'position': [10.0, 1.0],
@@ -77,42 +130,43 @@ class AEBSimulation:
 			'size': [0.6, 1.8]
 		}]
 		result = self.aeb_system.process_scenario(close_scenario)
-		print(f"Emergency braking triggered: {result['decision']['braking']}")
-		print(f"TTC: {result['min_ttc']:.2f}s (threshold: {SafetyConstants.MIN_TTC_THRESHOLD}s)")
-		print("✓ Req 4 {}\n".format(
-			'PASSED' if result['decision']['braking'] and result['min_ttc'] < SafetyConstants.MIN_TTC_THRESHOLD else 'FAILED'
+		out(f"Emergency braking triggered: {result.decision.braking}")
+		out(f"TTC: {result.min_ttc:.2f}s (threshold: {SafetyConstants.MIN_TTC_THRESHOLD}s)")
+		out("✓ Req 4 {}\n".format(
+			'PASSED' if result.decision.braking and result.min_ttc < SafetyConstants.MIN_TTC_THRESHOLD else 'FAILED'
 		))
 
 		# Requirement 6: Response time <100ms
-		print("Testing Req 6: Response Time <100ms")
+		out("Testing Req 6: Response Time <100ms")
 		emergency_scenario = self.create_pedestrian_crossing_scenario()
 		result = self.aeb_system.process_scenario(emergency_scenario)
-		response_time = result['decision']['response_time'] * 1000
-		print(f"Response time: {response_time:.2f}ms (requirement: <100ms)")
-		print(f"✓ Req 6 {'PASSED' if response_time < 100 else 'FAILED'}\n")
+		response_time = result.decision.response_time * 1000
+		out(f"Response time: {response_time:.2f}ms (requirement: <100ms)")
+		out(f"✓ Req 6 {'PASSED' if response_time < 100 else 'FAILED'}\n")
 
 		# Requirement 7: Weather performance
-		print("Testing Req 7: Weather Performance")
+		out("Testing Req 7: Weather Performance")
 		self.aeb_system.sensor_system.set_weather_condition(WeatherCondition.LIGHT_RAIN)
 		self.aeb_system.process_scenario(emergency_scenario)
 		rain_reliability = self.aeb_system.sensor_system.get_sensor_reliability()
-		print(f"Sensor reliability in rain: {rain_reliability:.2f} (requirement: >0.9)")
-		print(f"✓ Req 7 {'PASSED' if rain_reliability >= SafetyConstants.WEATHER_ACCURACY_THRESHOLD else 'FAILED'}\n")
+		out(f"Sensor reliability in rain: {rain_reliability:.2f} (requirement: >0.9)")
+		out(f"✓ Req 7 {'PASSED' if rain_reliability >= SafetyConstants.WEATHER_ACCURACY_THRESHOLD else 'FAILED'}\n")
 
 		# Requirement 10: Sensor failure response
-		print("Testing Req 10: Sensor Failure Response")
+		out("Testing Req 10: Sensor Failure Response")
 		self.aeb_system.sensor_system.simulate_sensor_failure("camera")
 		self.aeb_system.sensor_system.simulate_sensor_failure("radar")
 		failure_result = self.aeb_system.process_scenario(emergency_scenario)
-		fail_safe_activated = failure_result['decision']['action'] == 'FAIL_SAFE'
-		print(f"Fail-safe activated on sensor failure: {fail_safe_activated}")
-		print(f"✓ Req 10 {'PASSED' if fail_safe_activated else 'FAILED'}\n")
+		fail_safe_activated = failure_result.decision.action == 'FAIL_SAFE'
+		out(f"Fail-safe activated on sensor failure: {fail_safe_activated}")
+		out(f"✓ Req 10 {'PASSED' if fail_safe_activated else 'FAILED'}\n")
 
-		print("=== Performance Summary ===")
+		out("=== Performance Summary ===")
 		report = self.aeb_system.get_performance_report()
 		for key, value in report.items():
 			if key != 'event_log':
-				print(f"{key}: {value}")
+				out(f"{key}: {value}")
+		(sys.stdout if stream is None else stream).write(buf.getvalue())
 		return report
 
 
@@ -1,65 +1,155 @@
 """Core AEBSystem integration (relocated)."""
-from typing import List
+import math
+from typing import List, Optional, Tuple
 import numpy as np
 from .sensors import SensorSystem
 from .threat import ThreatAssessment
 from .decision import SafetyDecisionEngine
 from .constants import SafetyConstants
-from .models import DetectedObject
+from .models import Decision, Detections, FrameResult
+from .metrics import PerfMetrics
+
+_RANGE = SafetyConstants.MAX_DETECTION_RANGE
+_RANGE_SQ = _RANGE ** 2
+# Below this many objects building an array costs more than it saves
+_VECTOR_MIN_OBJECTS = 32
+
+
+def _count_in_range(objects: List[dict]) -> int:
+	if len(objects) < _VECTOR_MIN_OBJECTS:
+		return sum(1 for o in objects if math.hypot(o['position'][0], o['position'][1]) <= _RANGE)
+	pos = np.asarray([o['position'] for o in objects], dtype=np.float64).reshape(-1, 2)
+	# Compare squared distances: no sqrt needed for a range test
+	return int(np.count_nonzero(np.einsum('ij,ij->i', pos, pos) <= _RANGE_SQ))
+
 
 class AEBSystem:
-	def __init__(self, vehicle_speed: float = 30.0):
-		self.sensor_system = SensorSystem()
+	def __init__(self, vehicle_speed: float = 30.0, seed: Optional[int] = None):
+		self.sensor_system = SensorSystem(seed)
 		self.threat_assessment = ThreatAssessment(vehicle_speed)
 		self.decision_engine = SafetyDecisionEngine()
 		self.vehicle_speed = vehicle_speed
-		self.performance_metrics = {
-			'total_decisions': 0,
-			'emergency_braking_events': 0,
-			'false_positives': 0,
-			'response_times': [],
-			'detection_accuracy': []
-		}
+		self.perf = PerfMetrics()
+		# Static object columns for process_scenario_incremental and the objects
+		# they were built for (held by reference so identities cannot be recycled).
+		self._object_columns = None
+		self._column_objects = ()
+
+	def _columns_valid(self, scenario_objects: List[dict]) -> bool:
+		cached = self._column_objects
+		return (
+			self._object_columns is not None
+			and len(cached) == len(scenario_objects)
+			and all(a is b for a, b in zip(cached, scenario_objects))
+		)
+
+	def invalidate_detection_cache(self):
+		self._object_columns = None
+		self._column_objects = ()
+
+	def process_scenario(self, scenario_objects: List[dict]) -> FrameResult:
+		detected_objects = self.sensor_system.detect_objects(scenario_objects)
+		return self._evaluate(scenario_objects, detected_objects)
+
+	def process_scenario_fast(self, scenario_objects: List[dict], detailed: bool = False) -> FrameResult:
+		"""Variant of ``process_scenario`` that drops the detection batch.
 
-	def process_scenario(self, scenario_objects: List[dict]) -> dict:
+		Only counts and the single threat row are kept; the batch is attached
+		when ``detailed`` is True (e.g. for logging).
+		"""
 		detected_objects = self.sensor_system.detect_objects(scenario_objects)
+		frame = self._evaluate(scenario_objects, detected_objects)
+		return frame if detailed else frame._replace(detected_objects=None)
+
+	def process_scenarios_batch(self, positions: np.ndarray, velocities: np.ndarray,
+								type_codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+		"""Run K independent frames of N objects through sensing and threat assessment.
+
+		``positions`` / ``velocities`` are (K, N, 2); ``type_codes`` is (N,) or
+		(K, N) (see ``TYPE_CODES_BY_VALUE``). Sensor drops and noise are drawn
+		once for the whole batch. Returns per-frame ``(triggered, min_ttc)``
+		arrays. Intended for Monte-Carlo validation sweeps: the stateful
+		decision engine and performance metrics are not involved.
+		"""
+		positions = np.asarray(positions, dtype=np.float64)
+		velocities = np.asarray(velocities, dtype=np.float64)
+		k, n = positions.shape[:2]
+		keep, noise = self.sensor_system.sample_detections_batch(k, n)
+		d2 = np.einsum('kni,kni->kn', positions, positions)
+		return self.threat_assessment.assess_batch(
+			positions[..., 1] + noise[..., 1],
+			velocities[..., 0],
+			np.sqrt(d2),
+			np.broadcast_to(type_codes, (k, n)),
+			keep & (d2 <= _RANGE_SQ),
+		)
+
+	def process_scenario_incremental(self, scenario_objects: List[dict]) -> FrameResult:
+		"""Re-evaluate a scenario whose objects have only moved since the last call.
+
+		Sensor drops, noise and confidences are drawn fresh every call, exactly
+		as in ``process_scenario`` (a miss or noise offset must not persist
+		across ticks). Only the deterministic per-object columns (type codes and
+		sizes) are reused; they are rebuilt when the object set changes or
+		``invalidate_detection_cache`` was called. Positions and velocities are
+		read on every call.
+		"""
+		if not self._columns_valid(scenario_objects):
+			self._object_columns = self.sensor_system.object_columns(scenario_objects)
+			self._column_objects = tuple(scenario_objects)
+		sensors = self.sensor_system
+		detected_objects = sensors.detections_from_samples(
+			scenario_objects, sensors.sample_detections(scenario_objects), self._object_columns
+		)
+		return self._evaluate(scenario_objects, detected_objects)
+
+	def _evaluate(self, scenario_objects: List[dict], detected_objects: Detections) -> FrameResult:
 		threat_detected, threat_object, min_ttc_trigger, min_ttc_all = self.threat_assessment.assess_collision_risk(detected_objects)
 		sensor_reliability = self.sensor_system.get_sensor_reliability()
 		decision = self.decision_engine.make_safety_decision(threat_detected, threat_object, min_ttc_trigger, sensor_reliability)
 		self.update_metrics(decision, detected_objects, scenario_objects)
-		return {
-			'detected_objects': detected_objects,
-			'threat_detected': threat_detected,
-			'threat_object': threat_object,
-			'min_ttc': min_ttc_trigger,
-			'min_ttc_all': min_ttc_all,
-			'decision': decision,
-			'sensor_reliability': sensor_reliability,
-			'system_state': self.decision_engine.system_state.value
-		}
+		return FrameResult(
+			threat_detected=threat_detected,
+			min_ttc=min_ttc_trigger,
+			min_ttc_all=min_ttc_all,
+			decision=decision,
+			sensor_reliability=sensor_reliability,
+			system_state=self.decision_engine.system_state.value,
+			detected_count=len(detected_objects),
+			threat_object=threat_object,
+			detected_objects=detected_objects,
+		)
+
+	@property
+	def performance_metrics(self) -> dict:
+		"""Read-only dict view of ``perf`` in the former layout."""
+		return self.perf.as_dict()
+
+	def update_metrics(self, decision: Decision, detected: Detections, actual: List[dict]):
+		in_range = getattr(detected, 'in_range', None)
+		if in_range is None:
+			in_range = _count_in_range(actual)
+		accuracy = min(1.0, len(detected) / max(1, in_range))
+		self.perf.record(decision.response_time, accuracy, decision.action == 'EMERGENCY_BRAKE')
 
-	def update_metrics(self, decision: dict, detected: List[DetectedObject], actual: List[dict]):
-		self.performance_metrics['total_decisions'] += 1
-		if decision['action'] == 'EMERGENCY_BRAKE':
-			self.performance_metrics['emergency_braking_events'] += 1
-		self.performance_metrics['response_times'].append(decision['response_time'])
-		in_range_actual = [o for o in actual if (o['position'][0]**2 + o['position'][1]**2) ** 0.5 <= SafetyConstants.MAX_DETECTION_RANGE]
-		baseline = max(1, len(in_range_actual))
-		accuracy = min(1.0, len(detected) / baseline)
-		self.performance_metrics['detection_accuracy'].append(accuracy)
+	def merge_metrics(self, other: "AEBSystem"):
+		"""Fold another system's performance metrics and events into this one."""
+		self.perf.merge(other.perf)
+		self.decision_engine.event_log.extend(other.decision_engine.event_log)
 
 	def get_performance_report(self) -> dict:
-		if not self.performance_metrics['response_times']:
+		perf = self.perf
+		if not perf.total_decisions:
 			return {'error': 'No data collected yet'}
-		avg_response_time = np.mean(self.performance_metrics['response_times'])
-		avg_accuracy = np.mean(self.performance_metrics['detection_accuracy'])
+		avg_response_time = perf.rt_mean
+		avg_accuracy = perf.accuracy_mean
 		return {
-			'total_decisions': self.performance_metrics['total_decisions'],
-			'emergency_events': self.performance_metrics['emergency_braking_events'],
+			'total_decisions': perf.total_decisions,
+			'emergency_events': perf.emergency_braking_events,
 			'avg_response_time': avg_response_time,
-			'max_response_time': max(self.performance_metrics['response_times']),
+			'max_response_time': perf.rt_max,
 			'avg_detection_accuracy': avg_accuracy,
 			'req_6_compliance': avg_response_time <= SafetyConstants.MAX_RESPONSE_TIME,
 			'req_2_compliance': avg_accuracy >= SafetyConstants.MIN_DETECTION_ACCURACY,
-			'event_log': self.decision_engine.event_log
+			'event_log': self.decision_engine.timestamped_events()
 		}
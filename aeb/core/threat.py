@@ -1,37 +1,149 @@
-"""Core threat assessment (relocated)."""
-from typing import List, Tuple, Optional
-from .models import DetectedObject
+"""Core threat assessment (relocated).
+
+The collision-risk scan is a small numeric kernel over the detection columns.
+When Numba is installed (``pip install .[accel]``) it is compiled with
+``@njit``; otherwise an equivalent whole-array NumPy version is used.
+"""
+from typing import List, Tuple, Optional, Union
+import numpy as np
+from .models import DetectedObject, Detections
 from .constants import SafetyConstants
-from .enums import ObjectType
+from .enums import ObjectType, OBJECT_TYPE_CODES
+
+try:
+	from numba import njit, vectorize
+except ImportError:  # optional accelerator; NumPy fallback below
+	njit = vectorize = None
+
+# Kernel constants as module globals so Numba freezes them as literals (and
+# the NumPy path avoids class-attribute lookups); bound once at import.
+_LANE_HALF_WIDTH = SafetyConstants.LANE_HALF_WIDTH
+_MIN_TTC = SafetyConstants.MIN_TTC_THRESHOLD
+_VEHICLE_TTC = 1.0
+_VEHICLE_CODE = OBJECT_TYPE_CODES[ObjectType.VEHICLE]
+_TINY = 1e-30
+_INF = float('inf')
+
+
+def _assess_loop(pos_y, vx, dist, types, vehicle_ms):
+	"""Single pass returning (index, trigger_ttc, min_ttc_all); index is -1 if nothing triggers."""
+	idx = -1
+	best = np.inf
+	min_all = np.inf
+	for i in range(dist.shape[0]):
+		rel_v = vehicle_ms - vx[i]
+		# Every row is scanned (no early exit); invalid rows count as inf
+		valid = (rel_v > 0.0) & (abs(pos_y[i]) <= _LANE_HALF_WIDTH)
+		ttc = dist[i] / rel_v if valid else np.inf
+		min_all = min(min_all, ttc)
+		threshold = _VEHICLE_TTC if types[i] == _VEHICLE_CODE else _MIN_TTC
+		if ttc < threshold and ttc < best:
+			best = ttc
+			idx = i
+	return idx, best, min_all
+
+
+def _assess_numpy(pos_y, vx, dist, types, vehicle_ms):
+	"""Whole-array equivalent of ``_assess_loop`` (expects at least one row)."""
+	rel_v = vehicle_ms - vx
+	# One combined lane/closing mask; clamping the denominator keeps the
+	# division warning-free so every column goes through plain ufunc passes
+	valid = (rel_v > 0) & (np.abs(pos_y) <= _LANE_HALF_WIDTH)
+	ttc = np.where(valid, dist / np.maximum(rel_v, _TINY), np.inf)
+	threshold = np.where(types == _VEHICLE_CODE, _VEHICLE_TTC, _MIN_TTC)
+	triggered = np.where(ttc < threshold, ttc, np.inf)
+	# argmin returns the first minimum, matching the scan order of the loop
+	idx = int(np.argmin(triggered))
+	best = float(triggered[idx])
+	return (idx if best != np.inf else -1), best, float(ttc.min())
+
+
+def _ttc_scalar(dist, vx, vehicle_ms):
+	"""Per-element TTC (inf when not closing); compiled to a ufunc under Numba."""
+	rel_v = vehicle_ms - vx
+	return dist / rel_v if rel_v > 0.0 else np.inf
+
+
+def _ttc_numpy(dist, vx, vehicle_ms):
+	"""Broadcasting NumPy equivalent of ``_ttc_scalar``."""
+	rel_v = vehicle_ms - vx
+	return np.where(rel_v > 0, dist / np.maximum(rel_v, _TINY), np.inf)
+
+
+# Without Numba, the per-call overhead of the ufunc chain outweighs the
+# interpreted loop for small scenes (measured crossover around 16 rows).
+_SCALAR_MAX_ROWS = 16
+
+if njit is not None:
+	# No ninf/nnan fast-math flags: the kernel relies on inf as "no threat"
+	_assess_kernel = njit(
+		cache=True, nogil=True, boundscheck=False, fastmath={"nsz", "arcp", "contract", "reassoc"}
+	)(_assess_loop)
+	# Compile now (column-slice layout, as passed at runtime) so the first frame is not a JIT stall
+	_warm = np.zeros((1, 2))
+	_assess_kernel(_warm[:, 1], _warm[:, 0], np.zeros(1), np.zeros(1, dtype=np.int8), 0.0)
+	del _warm
+	# Eager signature: one fused pass over any broadcast shape, no temporaries for rel_v
+	_ttc_ufunc = vectorize(["float64(float64, float64, float64)"], cache=True)(_ttc_scalar)
+else:
+	_assess_kernel = _assess_numpy
+	_ttc_ufunc = _ttc_numpy
 
 class ThreatAssessment:
 	def __init__(self, vehicle_speed: float):
 		self.vehicle_speed = vehicle_speed
 
-	def calculate_time_to_collision(self, obj: DetectedObject) -> float:
-		vehicle_speed_ms = self.vehicle_speed / 3.6
-		relative_velocity = vehicle_speed_ms - obj.velocity[0]
-		if relative_velocity <= 0:
-			return float('inf')
-		ttc = obj.distance / relative_velocity
-		return max(0, ttc)
-
-	def assess_collision_risk(self, objects: List[DetectedObject]) -> Tuple[bool, Optional[DetectedObject], float, float]:
-		highest_risk_object = None
-		min_ttc_trigger = float('inf')
-		min_ttc_all = float('inf')
-		emergency_required = False
-		for obj in objects:
-			if abs(obj.position[1]) > 2.0:
-				continue
-			ttc = self.calculate_time_to_collision(obj)
-			if ttc < min_ttc_all:
-				min_ttc_all = ttc
-			threshold = SafetyConstants.MIN_TTC_THRESHOLD
-			if obj.type == ObjectType.VEHICLE:
-				threshold = 1.0
-			if ttc < threshold and ttc < min_ttc_trigger:
-				min_ttc_trigger = ttc
-				highest_risk_object = obj
-				emergency_required = True
-		return emergency_required, highest_risk_object, min_ttc_trigger, min_ttc_all
+	@property
+	def vehicle_speed(self) -> float:
+		"""Ego speed in km/h; the m/s value used by the kernels is cached on assignment."""
+		return self._vehicle_speed
+
+	@vehicle_speed.setter
+	def vehicle_speed(self, value: float):
+		self._vehicle_speed = value
+		self._vehicle_speed_ms = value / 3.6
+
+	def assess_collision_risk(self, objects: Union[Detections, List[DetectedObject]]) -> Tuple[bool, Optional[DetectedObject], float, float]:
+		"""Find the in-lane object with the lowest TTC below its braking threshold.
+
+		Runs ``_assess_kernel`` over the struct-of-arrays columns; only the
+		winning row is materialized as a ``DetectedObject``. A plain list of
+		``DetectedObject`` is accepted and packed first.
+		"""
+		if not isinstance(objects, Detections):
+			objects = Detections.from_objects(objects)
+		# Only in-lane rows reach the kernel; lane maps results back to batch rows
+		lane = np.flatnonzero(objects.in_lane)
+		if not len(lane):
+			return False, None, _INF, _INF
+		idx, ttc, min_ttc_all = self.assess_columns(
+			objects.positions[lane, 1], objects.velocities[lane, 0], objects.distances[lane], objects.type_codes[lane]
+		)
+		if idx < 0:
+			return False, None, _INF, min_ttc_all
+		return True, objects[int(lane[idx])], ttc, min_ttc_all
+
+	def assess_columns(self, pos_y: np.ndarray, vx: np.ndarray, dist: np.ndarray,
+					   type_codes: np.ndarray) -> Tuple[int, float, float]:
+		"""Run the kernel on raw columns: ``(index or -1, trigger_ttc, min_ttc_all)``."""
+		if not len(dist):
+			return -1, _INF, _INF
+		kernel = _assess_loop if njit is None and len(dist) < _SCALAR_MAX_ROWS else _assess_kernel
+		idx, ttc, min_ttc_all = kernel(pos_y, vx, dist, type_codes, self._vehicle_speed_ms)
+		return int(idx), float(ttc), float(min_ttc_all)
+
+	def assess_batch(self, pos_y: np.ndarray, vx: np.ndarray, dist: np.ndarray,
+					 type_codes: np.ndarray, valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+		"""Evaluate K frames at once over (K, N) columns.
+
+		``valid`` masks out dropped or out-of-range rows. Returns per-frame
+		``(triggered, min_ttc)``, where ``min_ttc`` is the lowest triggering TTC
+		(inf when nothing triggers).
+		"""
+		if not pos_y.shape[1]:
+			return np.zeros(pos_y.shape[0], dtype=bool), np.full(pos_y.shape[0], np.inf)
+		in_lane = valid & (np.abs(pos_y) <= _LANE_HALF_WIDTH)
+		ttc = np.where(in_lane, _ttc_ufunc(dist, vx, self._vehicle_speed_ms), np.inf)
+		threshold = np.where(type_codes == _VEHICLE_CODE, _VEHICLE_TTC, _MIN_TTC)
+		min_ttc = np.where(ttc < threshold, ttc, np.inf).min(axis=1)
+		return np.isfinite(min_ttc), min_ttc
@@ -1,7 +1,7 @@
 """Theme & style centralization for AEB GUI.
 Provides ThemeManager with light/dark palettes and font definitions.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 @dataclass(frozen=True)
 class Palette:
@@ -48,23 +48,25 @@ FONT_SMALL = (FONT_FAMILY, 9, "bold")
 FONT_VEHICLE = (FONT_FAMILY, 10, "bold")
 FONT_MONO = ("Consolas", 10)
 
+_PALETTE_FIELDS = tuple(f.name for f in fields(Palette))
+
 class ThemeManager:
     def __init__(self):
-        self._current = LIGHT
+        self._apply(LIGHT)
 
     @property
     def palette(self) -> Palette:
         return self._current
 
     def set_mode(self, mode: str):
-        if mode.lower() == "dark":
-            self._current = DARK
-        else:
-            self._current = LIGHT
+        self._apply(DARK if mode.lower() == "dark" else LIGHT)
 
-    # Convenience passthroughs (optional)
-    def __getattr__(self, item):  # simple delegation to palette
-        return getattr(self._current, item)
+    def _apply(self, palette: Palette):
+        # Copy colors onto the instance so THEME.bg etc. are plain attribute
+        # reads rather than a __getattr__ fallback per access.
+        self._current = palette
+        for name in _PALETTE_FIELDS:
+            setattr(self, name, getattr(palette, name))
 
 THEME = ThemeManager()
 
@@ -0,0 +1,531 @@
+"""Main Tkinter application window for the AEB prototype GUI.
+
+Split out of ``aeb.aeb_gui`` so that importing that module (layout / style
+constants, ``choose_color``) does not pull in Tkinter, the AEB core or the
+panel widgets; ``aeb.aeb_gui.AEBGuiApp`` resolves to this class on demand.
+
+Security / Quality Notes:
+        * Scenario generation uses a seeded-once ``random.Random`` (Mersenne
+            Twister). The draws are simulation-only with no cryptographic use, so
+            the Sonar S2245 hotspot is reviewed and suppressed inline; SystemRandom
+            paid an OS entropy read for every draw.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from aeb.core.system import AEBSystem
+from aeb.core.constants import SafetyConstants
+from aeb.core.enums import WeatherCondition, TYPE_CODES_BY_VALUE
+from aeb.theme import FONT_TITLE, FONT_SECTION, FONT_MONO
+from aeb.ui.components.canvas_view import CanvasView
+from aeb.ui.components.panels.controls_panel import ControlsPanel
+from aeb.ui.components.panels.status_panel import StatusPanel
+from aeb.ui.components.panels.history_panel import HistoryPanel
+from aeb.ui.components.panels.metrics_panel import MetricsPanel
+from aeb.aeb_gui import (
+    CANVAS_WIDTH, CANVAS_HEIGHT,
+    COLOR_PRIMARY, COLOR_BG, COLOR_WARN, COLOR_ERR,
+    EGO_SPEED_MPS, SIM_TICK_MS, MAX_SIM_TIME_S, COLLISION_DISTANCE_M,
+    _OBJECT_TYPES,
+)
+
+RNG = random.Random()  # NOSONAR S2245 - simulation PRNG; no cryptographic use
+
+# Immutable history snapshot of one scenario object (tuple-valued fields).
+ScenarioObj = namedtuple("ScenarioObj", "type position velocity size")
+
+# Widget option bundles resolved once at import and splatted into create_widgets.
+_TITLE_CFG = dict(fg="white", bg=COLOR_PRIMARY, font=FONT_TITLE)
+_SECTION_CFG = dict(font=FONT_SECTION, bg=COLOR_BG)
+_LOG_CFG = dict(width=34, height=16, state="disabled", bg="#f8f8f8", font=FONT_MONO)
+
+# Weather combobox value -> enum member (plain dict lookup per selection).
+_WEATHER_BY_VALUE = {w.value: w for w in WeatherCondition}
+
+class AEBGuiApp(tk.Tk):
+    """Main Tkinter application window for the AEB prototype GUI."""
+    def __init__(self):
+        super().__init__()
+        # Set up main window properties
+        self.title("AEB Safety-Critical Prototype GUI")
+        # Add more horizontal room for extended log + controls and vertical for larger canvas
+        # Increased extra vertical padding from +90 to +180 for more space
+        self.geometry(f"{CANVAS_WIDTH+340}x{CANVAS_HEIGHT+340}")
+        self.resizable(True, True)
+        self.minsize(900, 520)
+        self.configure(bg=COLOR_BG)
+        self._destroyed = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.aeb_system = AEBSystem()  # Core AEB logic
+        # Last environment settings pushed to the sensor model (see _apply_*)
+        self._last_weather_str = None
+        self._last_degradation = None
+        self.create_widgets()           # Build all UI widgets
+        self.current_scenario = []      # Store current scenario for visualization
+        # Animation state variables
+        self.sim_running = False
+        self.sim_elapsed = 0.0
+        self._after_id = None
+        self.animated_objects = []  # Mutable objects list during animation
+        # SoA kinematic state backing animated_objects (rows are shared views)
+        self._anim_pos = np.empty((0, 2))
+        self._anim_vel = np.empty((0, 2))
+        # Scenario history (simple ring buffer semantics)
+        self.scenario_history = []
+        self.max_history = 20
+        # Metrics counters
+        self.metric_total_scenarios = 0
+        self.metric_threat_scenarios = 0
+        self.metric_brake_events = 0
+        # Animation flags for metric aggregation
+        self._anim_threat_recorded = False
+        self._anim_brake_recorded = False
+        # Last rendered animation-tick signature (see _display_signature)
+        self._last_display_sig = None
+    # Removed dynamic TTC label per user request
+    # self.ttc_label = None
+
+
+    def create_widgets(self):
+        # Use grid layout
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        # Title bar
+        title_bar = tk.Frame(self, bg=COLOR_PRIMARY, height=40)
+        title_bar.grid(row=0, column=0, columnspan=3, sticky="nsew")
+        title_bar.grid_propagate(False)
+        tk.Label(title_bar, text="AEB Safety-Critical Prototype GUI", **_TITLE_CFG).pack(anchor="w", padx=12, pady=4)
+
+        # Left controls frame (component)
+        controls_frame = ControlsPanel(
+            self,
+            on_run_random=self.run_random_scenario,
+            on_manual=self.setup_manual_scenario,
+            on_run_anim=self.run_animated_scenario,
+            on_stop_anim=self.stop_animation,
+            on_clear=self.clear_canvas,
+            on_weather_changed=lambda _: self._apply_weather(),
+            on_degradation_changed=self._apply_degradation
+        )
+        controls_frame.grid(row=1, column=0, sticky="nsew", padx=(8,4), pady=(6,8))
+        self.controls_panel = controls_frame
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=0)
+        # Center canvas view container
+        canvas_container = tk.Frame(self, bg=COLOR_BG)
+        canvas_container.grid(row=1, column=1, sticky="nsew", pady=(6,8))
+        self.grid_columnconfigure(1, weight=1)
+        canvas_container.grid_rowconfigure(0, weight=1)
+        canvas_container.grid_columnconfigure(0, weight=1)
+        self.canvas_view = CanvasView(canvas_container, width=CANVAS_WIDTH, height=CANVAS_HEIGHT)
+        self.canvas_view.grid(row=0, column=0, sticky="nsew")
+        # Right side (log + status + history + metrics)
+        side_frame = tk.Frame(self, bg=COLOR_BG)
+        side_frame.grid(row=1, column=2, sticky="nsew", padx=(4,8), pady=(6,8))
+        self.grid_columnconfigure(2, weight=0)
+
+        # Link panel vars to legacy references for helper methods
+        self.weather_var = controls_frame.weather_var
+        self.degrade_var = controls_frame.degrade_var
+        self.degrade_prob_var = controls_frame.degrade_prob_var
+        self.degrade_scale = controls_frame.degrade_scale
+
+        # --- Results/logs panel ---
+        tk.Label(side_frame, text="System State / Log", **_SECTION_CFG).pack(anchor="w", pady=(0,2))
+        log_frame = tk.Frame(side_frame, bg=COLOR_BG)
+        log_frame.pack(fill="both", expand=False)
+        log_scroll = tk.Scrollbar(log_frame, orient="vertical")
+        self.log_text = tk.Text(log_frame, yscrollcommand=log_scroll.set, **_LOG_CFG)
+        log_scroll.config(command=self.log_text.yview)
+        self.log_text.grid(row=0, column=0, sticky="nsew")
+        log_scroll.grid(row=0, column=1, sticky="ns")
+        log_frame.grid_rowconfigure(0, weight=1)
+        log_frame.grid_columnconfigure(0, weight=1)
+
+        # --- Status indicators panel ---
+        self.status_panel = StatusPanel(side_frame)
+        self.status_panel.pack(fill="x", anchor="w", pady=(10,0))
+        # (TTC label removed; status relocated under log)
+
+        # --- History panel ---
+        self.history_panel = HistoryPanel(side_frame, on_replay=lambda idx: self._replay_index(idx), on_clear=self.clear_history)
+        self.history_panel.pack(fill="x", pady=(12,4))
+
+        # --- Metrics panel ---
+        self.metrics_panel = MetricsPanel(side_frame)
+        self.metrics_panel.pack(fill="x", pady=(4,8))
+
+    # (Degradation slider handled by ControlsPanel)
+
+    # Canvas drawing now handled by CanvasView component
+
+    def run_random_scenario(self):
+        # Generate a random scenario with 1-3 objects of random type, distance, and lateral position
+        num_objects = RNG.randint(1, 3)
+        scenario = []
+        for _ in range(num_objects):
+            obj_type = RNG.choice(_OBJECT_TYPES)
+            distance = RNG.uniform(5, SafetyConstants.MAX_DETECTION_RANGE)
+            lateral = RNG.uniform(-2, 2)
+            scenario.append({
+                'type': obj_type.value,
+                'type_code': TYPE_CODES_BY_VALUE[obj_type.value],
+                'position': [distance, lateral],
+                'velocity': [RNG.uniform(-5, 5), 0],
+                'size': [0.6, 1.8]
+            })
+        self._record_history(scenario)
+        self.visualize_scenario(scenario)
+
+    def setup_manual_scenario(self):
+        # Dialog for manual scenario (add one object with user input)
+        def add_object():
+            try:
+                obj_type = type_var.get()
+                distance = float(dist_var.get())
+                lateral = float(lat_var.get())
+                scenario = [{
+                    'type': obj_type,
+                    'type_code': TYPE_CODES_BY_VALUE[obj_type],
+                    'position': [distance, lateral],
+                    'velocity': [0, 0],
+                    'size': [0.6, 1.8]
+                }]
+                top.destroy()
+                self.visualize_scenario(scenario)
+                self._record_history(scenario)
+            except Exception as e:
+                messagebox.showerror("Input Error", str(e))
+        # Create dialog window
+        top = tk.Toplevel(self)
+        top.title("Manual Scenario Setup")
+        top.geometry("260x140")
+        top.resizable(False, False)
+        top.configure(bg="#f0f2f5")
+        # Object type selection
+        ttk.Label(top, text="Object Type:").grid(row=0, column=0, padx=6, pady=4, sticky="e")
+        type_var = tk.StringVar(value="pedestrian")
+        ttk.Combobox(top, textvariable=type_var, values=[t.value for t in _OBJECT_TYPES], width=14).grid(row=0, column=1, padx=6, pady=4)
+        # Distance input
+        ttk.Label(top, text="Distance (m):").grid(row=1, column=0, padx=6, pady=4, sticky="e")
+        dist_var = tk.StringVar(value="15")
+        ttk.Entry(top, textvariable=dist_var, width=16).grid(row=1, column=1, padx=6, pady=4)
+        # Lateral input
+        ttk.Label(top, text="Lateral (m):").grid(row=2, column=0, padx=6, pady=4, sticky="e")
+        lat_var = tk.StringVar(value="0")
+        ttk.Entry(top, textvariable=lat_var, width=16).grid(row=2, column=1, padx=6, pady=4)
+        # Add button
+        ttk.Button(top, text="Add Object", command=add_object).grid(row=3, column=0, columnspan=2, pady=8)
+
+    def visualize_scenario(self, scenario):
+        # Clear and redraw the canvas, then run the scenario through the AEB system
+        self.clear_canvas()
+        self.canvas_view.set_objects(scenario)
+        self.canvas_view.redraw_dynamic()
+        # Run scenario through AEB system logic
+        self._apply_weather()
+        self._apply_degradation()
+        result = self.aeb_system.process_scenario(scenario)
+        self.display_log(result)    # Show results in log
+        self.display_status(result) # Update colored status indicators
+        self._update_metrics(result, new_scenario=True)
+
+    def clear_canvas(self):
+        # Clear the canvas and log, reset status indicators
+        if self.sim_running:
+            self.stop_animation()
+        self.canvas_view.set_objects([])
+        self.canvas_view.redraw_dynamic()
+        self.log_text.config(state="normal")
+        self.log_text.delete(1.0, tk.END)
+        self.log_text.config(state="disabled")
+        self.display_status(None)
+        # TTC label removed – no reset needed
+
+    def display_log(self, result):
+        # Show the results of the scenario in the log panel
+        self.log_text.config(state="normal")
+        self.log_text.delete(1.0, tk.END)
+        if not result:
+            self.log_text.config(state="disabled")
+            return
+        # Show threat status and TTC information. Display both trigger TTC (used for decisions)
+        # and absolute min TTC (situational awareness) when applicable.
+        ttc_trigger = result.min_ttc
+        ttc_all = result.min_ttc_all
+        finite_trigger = ttc_trigger != float('inf')
+        finite_all = ttc_all != float('inf')
+        if result.threat_detected:
+            if finite_trigger and finite_all and abs(ttc_trigger - ttc_all) > 1e-3:
+                threat_line = f"Threat: YES (Trigger TTC: {ttc_trigger:.2f}s | Min TTC: {ttc_all:.2f}s)"
+            elif finite_trigger:
+                threat_line = f"Threat: YES (TTC: {ttc_trigger:.2f}s)"
+            elif finite_all:
+                threat_line = f"Threat: YES (Min TTC: {ttc_all:.2f}s)"
+            else:
+                threat_line = "Threat: YES"
+        else:
+            if finite_all:
+                threat_line = f"Threat: NO (Min TTC: {ttc_all:.2f}s)"
+            else:
+                threat_line = "Threat: NO"
+        decision = result.decision
+        lines = [
+            f"Detected: {result.detected_count}",
+            threat_line,
+            f"System State: {result.system_state}",
+            f"Decision: {decision.action}",
+            f"Warning: {decision.warning}",
+            f"Braking: {decision.braking}",
+            f"Message: {decision.message}",
+        ]
+        # One Text insert (single Tcl round-trip) instead of one per line
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+        self.log_text.config(state="disabled")
+
+    def display_status(self, result):
+        # Delegate to StatusPanel for UI updates
+        self.status_panel.update_status(result)
+        # (Removed TTC label updates)
+
+    # ------------------------------------------------------------------
+    # Animated Simulation Mode
+    # ------------------------------------------------------------------
+    def run_animated_scenario(self):
+        """Generate and start an animated time‑stepped scenario.
+
+        Objects have longitudinal distance (m) updated each tick using
+        relative closure speed: ego_speed - object_longitudinal_velocity.
+
+        Stops when:
+            * Emergency braking triggers
+            * A collision threshold is reached
+            * Max simulation time elapses
+            * User presses Stop Animation
+        """
+        if self.sim_running:
+            return  # Ignore if already running
+        # Build a fresh random scenario (slightly constrained for clarity)
+        count = RNG.randint(1, 3)
+        types = [RNG.choice(_OBJECT_TYPES).value for _ in range(count)]
+        # Kinematic state as struct-of-arrays: one (N, 2) array each for position
+        # and velocity, advanced with a single vectorized update per tick.
+        self._anim_pos = np.array(
+            [[RNG.uniform(10, SafetyConstants.MAX_DETECTION_RANGE), RNG.uniform(-1.5, 1.5)] for _ in range(count)]
+        )
+        self._anim_vel = np.array(
+            [[RNG.uniform(-2, 2), 0.0] for _ in range(count)]  # small longitudinal variation
+        )
+        # Scenario dicts reference row views of the arrays, so rendering and the
+        # AEB pipeline observe each tick's update without copying back.
+        self.animated_objects = [
+            {
+                'type': obj_type,
+                'type_code': TYPE_CODES_BY_VALUE[obj_type],
+                'position': self._anim_pos[i],
+                'velocity': self._anim_vel[i],
+                'size': [0.6, 1.8]
+            }
+            for i, obj_type in enumerate(types)
+        ]
+        self.sim_running = True
+        self.sim_elapsed = 0.0
+        self._anim_threat_recorded = False
+        self._anim_brake_recorded = False
+        self._last_display_sig = None
+        # Initial draw of static background once (already present) and first frame objects
+        self.canvas_view.set_objects(self.animated_objects)
+        self.canvas_view.redraw_dynamic()
+        # Record scenario & metrics
+        self._record_history(self.animated_objects)
+        self._animation_step()
+
+    def _animation_step(self):
+        """Single animation tick: advance objects, re-evaluate system, redraw."""
+        if not self.sim_running:
+            return
+        dt = SIM_TICK_MS / 1000.0
+        self.sim_elapsed += dt
+        # Advance all objects toward ego (closing distance) in one vectorized step
+        pos = self._anim_pos
+        pos[:, 0] -= (EGO_SPEED_MPS - self._anim_vel[:, 0]) * dt
+        # Evaluate scenario with updated positions
+        # Ensure current weather & degradation settings apply during animation
+        self._apply_weather()
+        self._apply_degradation()
+        # Objects only moved since the last tick: reuse their static columns
+        # (type codes, sizes); sensor drops and noise are redrawn every tick.
+        result = self.aeb_system.process_scenario_incremental(self.animated_objects)
+        # Redraw scene
+        # Delete only dynamic items (performance optimization)
+        # Choose ego vehicle color based on current system state for better feedback
+        decision = result.decision
+        braking = decision.braking
+        vehicle_color = COLOR_ERR if braking else (COLOR_WARN if decision.warning else COLOR_PRIMARY)
+        # Redraw dynamic layer via CanvasView
+        self.canvas_view.redraw_dynamic(ego_color=vehicle_color)
+        # Refresh textual/log + status only when something they render changed;
+        # between threshold crossings consecutive ticks are often identical.
+        sig = self._display_signature(result)
+        if sig != self._last_display_sig:
+            self._last_display_sig = sig
+            self.display_log(result)
+            self.display_status(result)
+        self._update_metrics(result, new_scenario=False)
+        # Determine stop conditions
+        stop_reason = None
+        if braking:
+            stop_reason = "Emergency braking triggered"
+        elif np.any(pos[:, 0] <= COLLISION_DISTANCE_M):
+            stop_reason = "Collision threshold reached"
+        if self.sim_elapsed >= MAX_SIM_TIME_S and stop_reason is None:
+            stop_reason = "Max simulation time reached"
+        if stop_reason:
+            self._finalize_animation(stop_reason)
+            return
+        # Schedule next tick if window still exists (flag set by _on_close,
+        # avoiding a winfo_exists() Tcl round-trip every tick)
+        if not self._destroyed:
+            self._after_id = self.after(SIM_TICK_MS, self._animation_step)
+
+    @staticmethod
+    def _display_signature(result):
+        """Key of every field display_log/display_status render (TTCs at display precision)."""
+        decision = result.decision
+        return (
+            result.detected_count,
+            result.threat_detected,
+            round(result.min_ttc, 2),
+            round(result.min_ttc_all, 2),
+            result.system_state,
+            decision.action,
+            decision.warning,
+            decision.braking,
+        )
+
+    def _finalize_animation(self, reason):
+        """Stop animation loop and append reason to log."""
+        self.sim_running = False
+        if self._after_id:
+            try:
+                self.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self.log_text.config(state="normal")
+        self.log_text.insert(tk.END, f"\n[Animation stopped] {reason}\n")
+        self.log_text.config(state="disabled")
+        # Ensure final metrics capture any late braking state
+        # (Already updated each tick, so no action needed here.)
+
+    def _on_close(self):
+        """Window close handler: flag destruction so no further ticks are scheduled."""
+        self._destroyed = True
+        if self._after_id:
+            try:
+                self.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self.destroy()
+
+    def stop_animation(self):
+        """User-triggered termination of the animated scenario."""
+        if not self.sim_running:
+            return
+        self._finalize_animation("Stopped by user")
+
+    # ------------------------------------------------------------------
+    # Weather / Degradation Helpers
+    # ------------------------------------------------------------------
+    def _apply_weather(self):
+        # Called every animation tick: only touch the sensor model on change.
+        sel = self.weather_var.get()
+        if sel == self._last_weather_str:
+            return
+        wc = _WEATHER_BY_VALUE.get(sel)
+        if wc is None:
+            return
+        self._last_weather_str = sel
+        self.aeb_system.sensor_system.set_weather_condition(wc)
+
+    def _apply_degradation(self):
+        active = bool(self.degrade_var.get())
+        # Use a fixed default probability; could be adjusted per weather later
+        prob = float(self.degrade_prob_var.get()) if active else 0.0
+        if (active, prob) == self._last_degradation:
+            return
+        self._last_degradation = (active, prob)
+        # Enable/disable scale visual feedback
+        state = "normal" if active else "disabled"
+        try:
+            self.degrade_scale.state([state])  # ttk widget state toggle
+        except Exception:
+            pass
+        self.aeb_system.sensor_system.set_detection_degradation(active, probability=prob)
+
+    # ------------------------------------------------------------------
+    # History / Metrics Helpers
+    # ------------------------------------------------------------------
+    def _record_history(self, scenario):
+        try:
+            # Freeze into immutable snapshots (animation mutates the live position
+            # lists); tuples can then be shared on replay without further copies.
+            stored = tuple(
+                ScenarioObj(o['type'], tuple(o['position']), tuple(o['velocity']), tuple(o['size']))
+                for o in scenario
+            )
+            self.scenario_history.append(stored)
+            if len(self.scenario_history) > self.max_history:
+                self.scenario_history.pop(0)
+            self._refresh_history_list()
+        except Exception:
+            pass
+
+    def _refresh_history_list(self):
+        # delegate to history_panel
+        self.history_panel.refresh(self.scenario_history)
+
+    def replay_selected_history(self):
+        self._replay_index(self.history_panel.get_selected_index())
+
+    def _replay_index(self, idx):
+        if idx is None:
+            return
+        try:
+            # Snapshots are immutable, so the replayed dicts can reference their tuples
+            self.visualize_scenario([o._asdict() for o in self.scenario_history[idx]])
+        except Exception:
+            pass
+
+    def clear_history(self):
+        self.scenario_history.clear()
+        self._refresh_history_list()
+
+    def _update_metrics(self, result, new_scenario: bool):
+        if new_scenario:
+            self.metric_total_scenarios += 1
+        if not result:
+            self._refresh_metrics_labels()
+            return
+        decision = result.decision
+        # One-shot scenarios count every hit; an animation counts at most once each.
+        if result.threat_detected and (new_scenario or not self._anim_threat_recorded):
+            self.metric_threat_scenarios += 1
+            if not new_scenario:
+                self._anim_threat_recorded = True
+        if decision.braking and (new_scenario or not self._anim_brake_recorded):
+            self.metric_brake_events += 1
+            if not new_scenario:
+                self._anim_brake_recorded = True
+        self._refresh_metrics_labels()
+
+    def _refresh_metrics_labels(self):
+        self.metrics_panel.update_values(self.metric_total_scenarios,
+                                         self.metric_threat_scenarios,
+                                         self.metric_brake_events)
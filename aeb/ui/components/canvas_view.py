@@ -1,5 +1,5 @@
 """CanvasView: resizable road & object rendering component."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import tkinter as tk
 from aeb.theme import THEME, FONT_VEHICLE, FONT_SMALL
 
@@ -16,6 +16,15 @@ class CanvasView(tk.Frame):
         self.canvas = tk.Canvas(self, bg=THEME.canvas_bg, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
         self._objects: List[Dict[str, Any]] = []
+        # Persistent dynamic item ids: (body, label) for the ego vehicle and a
+        # pool of (shadow, body, label) per object slot. Frames move them via
+        # coords() instead of delete + create; the pool only grows, and slots
+        # beyond the current object count are hidden (tag "obj<i>").
+        self._vehicle_items: Optional[Tuple[int, int]] = None
+        self._obj_items: List[Tuple[int, int, int]] = []
+        self._visible = 0
+        self._last_size = (0, 0)
+        self._resize_pending = False
         self.bind("<Configure>", self._on_resize)
         self.draw_static()
 
@@ -41,12 +50,37 @@ class CanvasView(tk.Frame):
         while x < w:
             self.canvas.create_line(x, cy, x+dlen, cy, fill="white", width=3, dash=(8,8), tags=("static",))
             x += gap
+        # Dynamic items persist across static redraws; keep the road beneath them
+        self.canvas.tag_lower("static")
 
     def redraw_dynamic(self, ego_color=None):
-        self.canvas.delete("dynamic")
+        c = self.canvas
+        if self._vehicle_items is None:
+            self._vehicle_items = (
+                c.create_rectangle(0, 0, 0, 0, outline="#003366", width=2, tags=("dynamic",)),
+                c.create_text(0, 0, text="Vehicle", font=FONT_VEHICLE, fill=THEME.text, tags=("dynamic",)),
+            )
+        n = len(self._objects)
+        while len(self._obj_items) < n:
+            self._obj_items.append(self._create_object_items(len(self._obj_items)))
+        # Toggle only slots whose visibility changed (one call per slot via its tag)
+        for i in range(self._visible, n):
+            c.itemconfigure(f"obj{i}", state="normal")
+        for i in range(n, self._visible):
+            c.itemconfigure(f"obj{i}", state="hidden")
+        self._visible = n
         self._draw_vehicle(ego_color)
-        for o in self._objects:
-            self._draw_object(o)
+        for items, o in zip(self._obj_items, self._objects):
+            self._draw_object(items, o)
+
+    def _create_object_items(self, slot):
+        c = self.canvas
+        tags = ("dynamic", f"obj{slot}")
+        return (
+            c.create_oval(0, 0, 0, 0, fill="#888888", outline="", stipple="gray25", state="hidden", tags=tags),
+            c.create_oval(0, 0, 0, 0, outline="#333", width=2, state="hidden", tags=tags),
+            c.create_text(0, 0, font=FONT_SMALL, fill=THEME.text, state="hidden", tags=tags),
+        )
 
     def _draw_vehicle(self, color=None):
         h = self.canvas.winfo_height() or self.base_height
@@ -56,10 +90,12 @@ class CanvasView(tk.Frame):
         x1 = x0 + VEHICLE_WIDTH
         y1 = cy + VEHICLE_HEIGHT//2
         col = color or THEME.primary
-        self.canvas.create_rectangle(x0, y0, x1, y1, fill=col, outline="#003366", width=2, tags=("dynamic",))
-        self.canvas.create_text((x0+x1)//2, y1+14, text="Vehicle", font=FONT_VEHICLE, fill=THEME.text, tags=("dynamic",))
+        body, label = self._vehicle_items
+        self.canvas.coords(body, x0, y0, x1, y1)
+        self.canvas.itemconfigure(body, fill=col)
+        self.canvas.coords(label, (x0+x1)//2, y1+14)
 
-    def _draw_object(self, obj):
+    def _draw_object(self, items, obj):
         h = self.canvas.winfo_height() or self.base_height
         cy = h // 2
         # Use base scaling; could adapt with width ratio later
@@ -67,13 +103,28 @@ class CanvasView(tk.Frame):
         y = cy + obj['position'][1] * SCALE_Y
         color_map = {"pedestrian": "#FF4136", "cyclist": "#2ECC40", "vehicle": "#FFDC00"}
         col = color_map.get(str(obj['type']), "#AAAAAA")
-        self.canvas.create_oval(x-9, y-5, x+9, y+11, fill="#888888", outline="", stipple="gray25", tags=("dynamic",))
-        self.canvas.create_oval(x-10, y-10, x+10, y+10, fill=col, outline="#333", width=2, tags=("dynamic",))
-        self.canvas.create_text(x, y-18, text=str(obj['type']).capitalize(), font=FONT_SMALL, fill=THEME.text, tags=("dynamic",))
+        shadow, body, label = items
+        self.canvas.coords(shadow, x-9, y-5, x+9, y+11)
+        self.canvas.coords(body, x-10, y-10, x+10, y+10)
+        self.canvas.itemconfigure(body, fill=col)
+        self.canvas.coords(label, x, y-18)
+        self.canvas.itemconfigure(label, text=str(obj['type']).capitalize())
 
     # ------------------------------------------------------------------
     # Resizing
     # ------------------------------------------------------------------
-    def _on_resize(self, _evt):
+    def _on_resize(self, evt):
+        # Tk repeats <Configure> at unchanged sizes; during a drag, coalesce the
+        # burst into one redraw once the event queue is idle.
+        size = (evt.width, evt.height)
+        if size == self._last_size:
+            return
+        self._last_size = size
+        if not self._resize_pending:
+            self._resize_pending = True
+            self.after_idle(self._apply_resize)
+
+    def _apply_resize(self):
+        self._resize_pending = False
         self.draw_static()
         self.redraw_dynamic()
@@ -5,41 +5,85 @@ from aeb.theme import FONT_LABEL_BOLD, FONT_LABEL, COLOR_BG, COLOR_OK, COLOR_WAR
 STATE_OK_SET = {"operational", "monitor"}
 STATE_WARN_SET = {"warning"}
 STATE_ERR_SET = {"emergency_braking", "sensor_failure"}
+# Lowercased state -> index into (ok, warn, err); one lookup per label
+_STATE_KIND = {
+    **dict.fromkeys(STATE_OK_SET, 0),
+    **dict.fromkeys(STATE_WARN_SET, 1),
+    **dict.fromkeys(STATE_ERR_SET, 2),
+}
 
 def choose_color(value, ok_color, warn_color, err_color):
     if value is None:
         return COLOR_NEUTRAL
-    if isinstance(value, bool):
-        return ok_color if value else err_color
+    # Identity checks on the bool singletons instead of isinstance
+    if value is True:
+        return ok_color
+    if value is False:
+        return err_color
     if isinstance(value, str):
-        norm = value.lower()
-        if norm in STATE_OK_SET:
-            return ok_color
-        if norm in STATE_WARN_SET:
-            return warn_color
-        if norm in STATE_ERR_SET:
-            return err_color
+        # States arrive lowercased; only other spellings pay for .lower()
+        kind = _STATE_KIND.get(value)
+        if kind is None:
+            kind = _STATE_KIND.get(value.lower())
+        if kind is not None:
+            return (ok_color, warn_color, err_color)[kind]
     return warn_color
 
+_RESET_STATUS = (
+    ("System State: -", COLOR_NEUTRAL),
+    ("Warning: -", COLOR_NEUTRAL),
+    ("Braking: -", COLOR_NEUTRAL),
+)
+
 class StatusPanel(tk.Frame):
-    """Panel showing system state, warning, braking indicators."""
+    """Panel showing system state, warning, braking indicators.
+
+    Label texts are bound to ``StringVar``s. Calls repeating the previous
+    (state, warning, braking) are ignored; otherwise labels whose (text, fg)
+    changed are queued and applied together on the next idle callback.
+    """
     def __init__(self, master):
         super().__init__(master, bg=COLOR_BG)
-        self.state_label = tk.Label(self, text="System State: -", font=FONT_LABEL_BOLD, bg=COLOR_BG)
+        self._state_var = tk.StringVar(self, value="System State: -")
+        self._warning_var = tk.StringVar(self, value="Warning: -")
+        self._brake_var = tk.StringVar(self, value="Braking: -")
+        self.state_label = tk.Label(self, textvariable=self._state_var, font=FONT_LABEL_BOLD, bg=COLOR_BG)
         self.state_label.pack(anchor="w", pady=(0,2))
-        self.warning_label = tk.Label(self, text="Warning: -", font=FONT_LABEL, bg=COLOR_BG)
+        self.warning_label = tk.Label(self, textvariable=self._warning_var, font=FONT_LABEL, bg=COLOR_BG)
         self.warning_label.pack(anchor="w", pady=(0,2))
-        self.brake_label = tk.Label(self, text="Braking: -", font=FONT_LABEL, bg=COLOR_BG)
+        self.brake_label = tk.Label(self, textvariable=self._brake_var, font=FONT_LABEL, bg=COLOR_BG)
         self.brake_label.pack(anchor="w", pady=(0,2))
+        self._labels = (self.state_label, self.warning_label, self.brake_label)
+        self._vars = (self._state_var, self._warning_var, self._brake_var)
+        self._last_key = ()  # inputs of the last update; () before the first
+        self._shown = [None, None, None]  # (text, fg) per label, once flushed
+        self._pending = {}
+        self._flush_pending = False
 
     def update_status(self, result):
-        if not result:
-            self.state_label.config(text="System State: -", fg=COLOR_NEUTRAL)
-            self.warning_label.config(text="Warning: -", fg=COLOR_NEUTRAL)
-            self.brake_label.config(text="Braking: -", fg=COLOR_NEUTRAL)
+        # Results often repeat the same safety state; skip those without any
+        # formatting or Tk traffic.
+        key = (result.system_state, result.decision.warning, result.decision.braking) if result else None
+        if key == self._last_key:
             return
-        sys_state = result['system_state']
-        decision = result['decision']
-        self.state_label.config(text=f"System State: {sys_state}", fg=choose_color(sys_state, COLOR_OK, COLOR_WARN, COLOR_ERR))
-        self.warning_label.config(text=f"Warning: {decision['warning']}", fg=choose_color(decision['warning'], COLOR_WARN, COLOR_WARN, COLOR_OK))
-        self.brake_label.config(text=f"Braking: {decision['braking']}", fg=choose_color(decision['braking'], COLOR_ERR, COLOR_WARN, COLOR_OK))
+        self._last_key = key
+        if key is None:
+            state, warn, brake = _RESET_STATUS
+        else:
+            sys_state, warning, braking = key
+            state = (f"System State: {sys_state}", choose_color(sys_state, COLOR_OK, COLOR_WARN, COLOR_ERR))
+            warn = (f"Warning: {warning}", choose_color(warning, COLOR_WARN, COLOR_WARN, COLOR_OK))
+            brake = (f"Braking: {braking}", choose_color(braking, COLOR_ERR, COLOR_WARN, COLOR_OK))
+        for i, new in enumerate((state, warn, brake)):
+            if new != self._shown[i]:
+                self._shown[i] = self._pending[i] = new
+        if self._pending and not self._flush_pending:
+            self._flush_pending = True
+            self.after_idle(self._flush)
+
+    def _flush(self):
+        self._flush_pending = False
+        pending, self._pending = self._pending, {}
+        for i, (text, fg) in pending.items():
+            self._vars[i].set(text)
+            self._labels[i].configure(fg=fg)
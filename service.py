@@ -7,65 +7,221 @@ Security Notes:
             environment variables SERVICE_CERT_FILE and SERVICE_KEY_FILE. When both
             are present the server wraps with SSLContext.
         * This service is not production‑grade; no auth / rate limiting.
+Backends:
+        * Default: stdlib ThreadingHTTPServer.
+        * SERVICE_BACKEND=aiohttp serves the same endpoints with aiohttp
+            (uvloop when installed); requires the ``service`` extra.
 """
 from __future__ import annotations
 
+import dataclasses
+import enum
 import json
 import os
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import ssl
-from typing import Any
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Optional, Tuple
 
 try:
     from aeb.core.system import AEBSystem  # type: ignore
 except Exception:  # pragma: no cover - service still offers /health
     AEBSystem = None  # fallback if import fails in minimal runtime
 
+try:
+    import orjson
+except ImportError:  # optional fast encoder; stdlib json fallback below
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib ``json`` hook for the types orjson encodes natively."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)  # e.g. Decision.threat_object
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if hasattr(obj, "tolist"):  # NumPy scalars / arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        # Returns bytes directly; NumPy scalars/arrays need no pre-conversion
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+# Constant bodies and their Content-Length values are encoded once at import.
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_LEN = str(len(_HEALTH_BODY))
+_NOT_FOUND_BODY = _dumps({"error": "not found"})
+_NOT_FOUND_LEN = str(len(_NOT_FOUND_BODY))
+
+# The sample scenario is fixed, so its encoded response is reused for a short
+# TTL instead of being recomputed on every monitoring probe.
+_SAMPLE_TTL = 1.0  # seconds
+# Read-only scenario shared by every refresh (process_scenario does not
+# mutate its input).
+_SAMPLE_SCENARIO = (MappingProxyType({
+    "type": "pedestrian",
+    "position": (12.0, 0.0),
+    "velocity": (0, 0),
+    "size": (0.6, 1.8),
+}),)
+_SAMPLE_CACHE: Optional[Tuple[float, bytes]] = None  # (monotonic stamp, body)
+_SYSTEM: Optional["AEBSystem"] = None
+_SYSTEM_LOCK = threading.Lock()
+# Requests are served on separate threads; one thread refreshes the cache
+# while the others wait for it rather than running the system concurrently.
+_SAMPLE_LOCK = threading.Lock()
+
+
+def _get_system() -> "AEBSystem":
+    """Shared AEBSystem, built once on first use (safe from any handler thread)."""
+    global _SYSTEM
+    if _SYSTEM is None:
+        with _SYSTEM_LOCK:
+            if _SYSTEM is None:
+                _SYSTEM = AEBSystem()
+    return _SYSTEM
+
+
+def _sample_body() -> bytes:
+    """Encoded /sample-decision payload, recomputed at most once per TTL."""
+    global _SAMPLE_CACHE
+    cached = _SAMPLE_CACHE
+    if cached is not None and time.monotonic() - cached[0] < _SAMPLE_TTL:
+        return cached[1]
+    with _SAMPLE_LOCK:
+        cached = _SAMPLE_CACHE
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _SAMPLE_TTL:
+            return cached[1]
+        result = _get_system().process_scenario(_SAMPLE_SCENARIO)
+        body = _dumps({"decision": result.decision.to_dict(), "min_ttc": result.min_ttc})
+        _SAMPLE_CACHE = (now, body)
+        return body
+
 
 class _Handler(BaseHTTPRequestHandler):
+    # Buffer the response stream: status line, headers and body leave in one
+    # socket write when handle_one_request flushes after do_GET (the default
+    # of 0 sends the header block and the body separately).
+    wbufsize = -1
+    # Persistent connections: probe loops reuse one TCP (and TLS) session.
+    # Every response carries Content-Length; idle connections are dropped
+    # after ``timeout`` seconds so they do not pin handler threads.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
+    def address_string(self) -> str:
+        # Always log the raw client IP, never a resolved host name
+        return self.client_address[0]
+
+    def log_request(self, code="-", size="-"):
+        # Successful liveness probes are not access-logged (they arrive at 1Hz+)
+        if code == 200 and self.path.partition("?")[0] == "/health":
+            return
+        super().log_request(code, size)
+
     def _send(self, code: int, payload: Any):  # helper
-        data = json.dumps(payload).encode("utf-8")
+        self._send_raw(code, _dumps(payload))
+
+    def _send_raw(self, code: int, data: bytes, ctype: str = "application/json",
+                  length: Optional[str] = None):
+        """Write an already-encoded body; ``length`` is a precomputed Content-Length."""
         self.send_response(code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", length or str(len(data)))
+        if not self.close_connection:
+            self.send_header("Connection", "keep-alive")
         self.end_headers()
         self.wfile.write(data)
 
-    def do_GET(self):  # noqa: N802 (BaseHTTPRequestHandler naming)
-        if self.path == "/health":
-            self._send(200, {"status": "ok"})
+    def _handle_health(self):
+        self._send_raw(200, _HEALTH_BODY, length=_HEALTH_LEN)
+
+    def _handle_sample(self):
+        if AEBSystem is None:
+            self._send(500, {"error": "AEBSystem unavailable"})
             return
-        if self.path == "/sample-decision":
-            if AEBSystem is None:
-                self._send(500, {"error": "AEBSystem unavailable"})
-                return
-            system = AEBSystem()
-            scenario = [{
-                "type": "pedestrian",
-                "position": [12.0, 0.0],
-                "velocity": [0, 0],
-                "size": [0.6, 1.8],
-            }]
-            result = system.process_scenario(scenario)
-            self._send(200, {"decision": result["decision"], "min_ttc": result["min_ttc"]})
+        self._send_raw(200, _sample_body())
+
+    # Path (query string stripped) -> handler; routing is one dict lookup
+    _ROUTES = {
+        "/health": _handle_health,
+        "/sample-decision": _handle_sample,
+    }
+
+    def do_GET(self):  # noqa: N802 (BaseHTTPRequestHandler naming)
+        handler = self._ROUTES.get(self.path.partition("?")[0])
+        if handler is None:
+            self._send_raw(404, _NOT_FOUND_BODY, length=_NOT_FOUND_LEN)
             return
-        self._send(404, {"error": "not found"})
+        handler(self)
 
 
-def run():  # pragma: no cover - integration behaviour tested via pipeline curl
-    port = int(os.environ.get("PORT", "8000"))
-    server = HTTPServer(("0.0.0.0", port), _Handler)
+def _ssl_context() -> Optional[ssl.SSLContext]:
+    """TLS context when SERVICE_CERT_FILE / SERVICE_KEY_FILE point at files."""
     cert = os.environ.get("SERVICE_CERT_FILE")
     key = os.environ.get("SERVICE_KEY_FILE")
-    if cert and key and os.path.exists(cert) and os.path.exists(key):
-        # Create secure TLS context (no deprecated protocols)
-        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-        ctx.minimum_version = ssl.TLSVersion.TLSv1_2
-        ctx.load_cert_chain(certfile=cert, keyfile=key)
+    if not (cert and key and os.path.exists(cert) and os.path.exists(key)):
+        return None
+    # Create secure TLS context (no deprecated protocols)
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    ctx.load_cert_chain(certfile=cert, keyfile=key)
+    return ctx
+
+
+def _run_aiohttp(port: int, ctx: Optional[ssl.SSLContext]):  # pragma: no cover - optional backend
+    """Serve the same endpoints on an asyncio event loop (``service`` extra)."""
+    from aiohttp import web
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    def _json(body: bytes, status: int = 200) -> web.Response:
+        return web.Response(status=status, body=body, content_type="application/json")
+
+    async def health(request):
+        return _json(_HEALTH_BODY)
+
+    async def sample(request):
+        if AEBSystem is None:
+            return _json(_dumps({"error": "AEBSystem unavailable"}), 500)
+        # Served from the TTL cache; a refresh is a sub-millisecond computation
+        return _json(_sample_body())
+
+    async def not_found(request):
+        return _json(_NOT_FOUND_BODY, 404)
+
+    app = web.Application()
+    app.router.add_get("/health", health)
+    app.router.add_get("/sample-decision", sample)
+    app.router.add_get("/{tail:.*}", not_found)
+    web.run_app(app, host="0.0.0.0", port=port, ssl_context=ctx, print=None)
+
+
+def run():  # pragma: no cover - integration behaviour tested via pipeline curl
+    port = int(os.environ.get("PORT", "8000"))
+    ctx = _ssl_context()
+    scheme = "https" if ctx else "http"
+    if os.environ.get("SERVICE_BACKEND") == "aiohttp":
+        print(f"[service] Listening on {scheme}://0.0.0.0:{port} (aiohttp)")
+        _run_aiohttp(port, ctx)
+        return
+    server = ThreadingHTTPServer(("0.0.0.0", port), _Handler)
+    # Slow /sample-decision requests no longer block /health probes; handler
+    # threads do not keep the process alive on Ctrl+C.
+    server.daemon_threads = True
+    if ctx:
         server.socket = ctx.wrap_socket(server.socket, server_side=True)
-        scheme = "https"
-    else:
-        scheme = "http"
     print(f"[service] Listening on {scheme}://0.0.0.0:{port}")
     try:
         server.serve_forever()
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+
+def _run(code):
+    """Execute *code* in a fresh interpreter so import side effects are observable."""
+    return subprocess.run(
+        [sys.executable, "-W", "error::DeprecationWarning", "-c", code],
+        capture_output=True, text=True, check=False,
+    )
+
+
+def test_package_import_skips_legacy_shims():
+    """
+    Test that importing the package root neither loads nor warns about the flat shim modules.
+    """
+    proc = _run(
+        "import sys, aeb\n"
+        "from aeb import AEBSystem, SafetyConstants\n"
+        "flat = {'constants','enums','models','sensors','threat','decision','system','simulation'}\n"
+        "loaded = [m for m in sys.modules if m.startswith('aeb.') and m.split('.', 1)[1] in flat]\n"
+        "assert not loaded, loaded\n"
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_legacy_module_attribute_warns_and_resolves_to_core():
+    """
+    Test that a deprecated flat module name resolves to its aeb.core module with a warning.
+    """
+    proc = _run(
+        "import warnings, aeb, aeb.core.system as core\n"
+        "with warnings.catch_warnings(record=True) as caught:\n"
+        "    warnings.simplefilter('always')\n"
+        "    assert aeb.system is core\n"
+        "    assert aeb.system.AEBSystem is core.AEBSystem\n"
+        "assert [w.category for w in caught] == [DeprecationWarning]\n"
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_every_import_path_yields_the_canonical_classes():
+    """
+    Test that root re-exports and legacy module names resolve to the aeb.core objects themselves.
+    """
+    proc = _run(
+        "import importlib, warnings, aeb\n"
+        "with warnings.catch_warnings():\n"
+        "    warnings.simplefilter('ignore', DeprecationWarning)\n"
+        "    for name, path in aeb._LEGACY.items():\n"
+        "        assert getattr(aeb, name) is importlib.import_module(path), name\n"
+        "for name, (path, attr) in aeb._LAZY.items():\n"
+        "    assert getattr(aeb, name) is getattr(importlib.import_module(path), attr), name\n"
+        "from aeb.core.system import AEBSystem\n"
+        "assert isinstance(aeb.AEBSystem(), AEBSystem) and aeb.system.AEBSystem is AEBSystem\n"
+    )
+    assert proc.returncode == 0, proc.stderr
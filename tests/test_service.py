@@ -0,0 +1,100 @@
+import json
+import threading
+import urllib.request
+from http.server import HTTPServer
+
+import pytest
+
+import service
+from aeb.core.system import AEBSystem
+
+
+@pytest.fixture(autouse=True)
+def seeded_service(monkeypatch):
+    """Fresh response cache and a seeded shared system, so results do not depend on test order."""
+    monkeypatch.setattr(service, "_SYSTEM", AEBSystem(seed=0))
+    monkeypatch.setattr(service, "_SAMPLE_CACHE", None)
+
+
+@pytest.fixture
+def base_url(monkeypatch):
+    monkeypatch.setattr(service._Handler, "log_message", lambda *args: None)
+    server = HTTPServer(("127.0.0.1", 0), service._Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as err:
+        return err.code, err.headers, err.read()
+
+
+def test_endpoints_return_json(base_url):
+    """
+    Test that health, sample decision and unknown paths answer with matching JSON bodies.
+    """
+    status, headers, body = _get(base_url + "/health")
+    assert status == 200 and json.loads(body) == {"status": "ok"}
+    assert int(headers["Content-Length"]) == len(body)
+    assert _get(base_url + "/health?check=1")[0] == 200
+
+    status, _, body = _get(base_url + "/sample-decision")
+    payload = json.loads(body)
+    assert status == 200 and payload["decision"]["action"] == "EMERGENCY_BRAKE"
+
+    status, _, body = _get(base_url + "/missing")
+    assert status == 404 and json.loads(body) == {"error": "not found"}
+
+
+def test_connection_is_reused_across_requests(base_url):
+    """
+    Test that HTTP/1.1 keep-alive serves several requests over one connection.
+    """
+    import http.client
+    conn = http.client.HTTPConnection(base_url.split("//")[1], timeout=5)
+    try:
+        sockets = []
+        for path in ("/health", "/missing", "/health"):
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.version == 11 and resp.getheader("Connection") == "keep-alive"
+            sockets.append(conn.sock)
+        assert sockets[0] is not None and all(sock is sockets[0] for sock in sockets)
+    finally:
+        conn.close()
+
+
+def test_sample_decision_without_orjson(base_url, monkeypatch):
+    """
+    Test that the stdlib json fallback encodes the decision, including its threat object.
+    """
+    monkeypatch.setattr(service, "orjson", None)
+    status, _, body = _get(base_url + "/sample-decision")
+    threat = json.loads(body)["decision"]["threat_object"]
+    assert status == 200 and threat["type"] == "pedestrian" and len(threat["position"]) == 2
+
+
+def test_sample_body_is_cached_within_ttl():
+    """
+    Test that the sample decision is encoded once per TTL window.
+    """
+    first = service._sample_body()
+    assert service._sample_body() is first
+
+
+def test_health_probes_are_not_access_logged(base_url, monkeypatch):
+    """
+    Test that successful /health probes skip the access log while other requests are logged.
+    """
+    logged = []
+    monkeypatch.setattr(service._Handler, "log_message", lambda self, fmt, *args: logged.append(fmt % args))
+    _get(base_url + "/health")
+    _get(base_url + "/missing")
+    assert len(logged) == 1 and "/missing" in logged[0] and logged[0].startswith('"GET')